@@ -4,9 +4,7 @@ from __future__ import annotations
 
 import logging
 
-import voluptuous as vol
-
-from homeassistant.const import CONF_DEVICE_ID, CONF_ENTITY_ID, CONF_NAME, Platform
+from homeassistant.const import CONF_ENTITY_ID, CONF_NAME, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import (
     config_validation as cv,
@@ -14,22 +12,31 @@ from homeassistant.helpers import (
     discovery,
     entity_registry as er,
 )
-
-from .const import ATTR_VIN, CONF_READ_ONLY, DOMAIN
-from .coordinator import BMWConfigEntry, BMWDataUpdateCoordinator
+from homeassistant.helpers.typing import ConfigType
+
+from .const import (
+    CONF_BACKGROUND_COMMANDS,
+    CONF_COMMAND_REFRESH_DELAY,
+    CONF_READ_ONLY,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    DEFAULT_COMMAND_REFRESH_DELAY,
+    DOMAIN,
+)
+from .coordinator import (
+    BMWConfigEntry,
+    BMWDataUpdateCoordinator,
+    get_snapshot_store,
+)
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 
-SERVICE_SCHEMA = vol.Schema(
-    vol.Any(
-        {vol.Required(ATTR_VIN): cv.string},
-        {vol.Required(CONF_DEVICE_ID): cv.string},
-    )
-)
-
 DEFAULT_OPTIONS = {
     CONF_READ_ONLY: False,
+    CONF_BACKGROUND_COMMANDS: False,
+    CONF_COMMAND_REFRESH_DELAY: DEFAULT_COMMAND_REFRESH_DELAY,
+    CONF_SKIP_REDUNDANT_COMMANDS: False,
 }
 
 PLATFORMS = [
@@ -44,7 +51,14 @@ PLATFORMS = [
     Platform.SWITCH,
 ]
 
-SERVICE_UPDATE_STATE = "update_state"
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the MyBMW actions."""
+
+    async_setup_services(hass)
+    return True
 
 
 @callback
@@ -59,7 +73,8 @@ def _async_migrate_options_from_data_if_missing(
             DEFAULT_OPTIONS,
             **{k: v for k, v in options.items() if k in DEFAULT_OPTIONS},
         )
-        options[CONF_READ_ONLY] = data.pop(CONF_READ_ONLY, False)
+        if CONF_READ_ONLY in data:
+            options[CONF_READ_ONLY] = data.pop(CONF_READ_ONLY)
 
         hass.config_entries.async_update_entry(entry, data=data, options=options)
 
@@ -133,7 +148,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: BMWConfigEntry) -> bool:
         hass,
         config_entry=entry,
     )
-    await coordinator.async_config_entry_first_refresh()
+    # Start with the last known vehicle data and refresh it in the background
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     entry.runtime_data = coordinator
 
@@ -156,6 +174,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: BMWConfigEntry) -> bool:
 
     # Clean up vehicles which are not assigned to the account anymore
     account_vehicles = {(DOMAIN, v.vin) for v in coordinator.account.vehicles}
+    # Keep the device of the account itself
+    account_vehicles.add((DOMAIN, entry.unique_id))
     device_registry = dr.async_get(hass)
     device_entries = dr.async_entries_for_config_entry(
         device_registry, config_entry_id=entry.entry_id
@@ -166,6 +186,11 @@ async def async_setup_entry(hass: HomeAssistant, entry: BMWConfigEntry) -> bool:
                 device.id, remove_config_entry_id=entry.entry_id
             )
 
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_refresh"
+        )
+
     return True
 
 
@@ -175,3 +200,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: BMWConfigEntry) -> bool
     return await hass.config_entries.async_unload_platforms(
         entry, [platform for platform in PLATFORMS if platform != Platform.NOTIFY]
     )
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: BMWConfigEntry) -> None:
+    """Remove the stored vehicle data of a config entry."""
+
+    await get_snapshot_store(hass, entry.entry_id).async_remove()
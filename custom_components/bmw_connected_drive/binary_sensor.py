@@ -2,15 +2,22 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
+import datetime
+from functools import lru_cache
 import logging
+from types import MappingProxyType
 from typing import Any
 
+from bimmer_connected.models import ValueWithUnit
 from bimmer_connected.vehicle import MyBMWVehicle
 from bimmer_connected.vehicle.doors_windows import LockState
 from bimmer_connected.vehicle.fuel_and_battery import ChargingState
-from bimmer_connected.vehicle.reports import ConditionBasedService
+from bimmer_connected.vehicle.reports import (
+    CheckControlStatus,
+    ConditionBasedServiceStatus,
+)
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -19,6 +26,7 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.util.unit_conversion import DistanceConverter
 from homeassistant.util.unit_system import UnitSystem
 
 from . import BMWConfigEntry
@@ -52,11 +60,20 @@ ALLOWED_CHECK_CONTROL_MESSAGE_KEYS = {
 }
 LOGGED_CHECK_CONTROL_MESSAGE_WARNINGS: set[str] = set()
 
+# Formatted attributes are cached on the report contents, so unchanged reports
+# are not formatted again and entities get the same read-only attributes
+ATTRIBUTE_CACHE_SIZE = 32
+
+type _CBSReport = tuple[
+    str, ConditionBasedServiceStatus, datetime.datetime | None, ValueWithUnit
+]
+type _CheckControlMessage = tuple[str, CheckControlStatus]
+
 
 def _condition_based_services(
     vehicle: MyBMWVehicle, unit_system: UnitSystem
-) -> dict[str, Any]:
-    extra_attributes = {}
+) -> Mapping[str, Any]:
+    reports: list[_CBSReport] = []
     for report in vehicle.condition_based_services.messages:
         if (
             report.service_type not in ALLOWED_CONDITION_BASED_SERVICE_KEYS
@@ -70,12 +87,24 @@ def _condition_based_services(
             LOGGED_CONDITION_BASED_SERVICE_WARNINGS.add(report.service_type)
             continue
 
-        extra_attributes.update(_format_cbs_report(report, unit_system))
-    return extra_attributes
+        reports.append(
+            (report.service_type, report.state, report.due_date, report.due_distance)
+        )
+    return _format_cbs_reports(tuple(reports), unit_system.length_unit)
 
 
-def _check_control_messages(vehicle: MyBMWVehicle) -> dict[str, Any]:
+@lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def _format_cbs_reports(
+    reports: tuple[_CBSReport, ...], length_unit: str
+) -> Mapping[str, Any]:
     extra_attributes: dict[str, Any] = {}
+    for report in reports:
+        extra_attributes.update(_format_cbs_report(*report, length_unit))
+    return MappingProxyType(extra_attributes)
+
+
+def _check_control_messages(vehicle: MyBMWVehicle) -> Mapping[str, Any]:
+    messages: list[_CheckControlMessage] = []
     for message in vehicle.check_control_messages.messages:
         if (
             message.description_short not in ALLOWED_CHECK_CONTROL_MESSAGE_KEYS
@@ -89,26 +118,43 @@ def _check_control_messages(vehicle: MyBMWVehicle) -> dict[str, Any]:
             LOGGED_CHECK_CONTROL_MESSAGE_WARNINGS.add(message.description_short)
             continue
 
-        extra_attributes[message.description_short.lower()] = message.state.value
-    return extra_attributes
+        messages.append((message.description_short, message.state))
+    return _format_check_control_messages(tuple(messages))
+
+
+@lru_cache(maxsize=ATTRIBUTE_CACHE_SIZE)
+def _format_check_control_messages(
+    messages: tuple[_CheckControlMessage, ...],
+) -> Mapping[str, Any]:
+    return MappingProxyType(
+        {
+            description_short.lower(): state.value
+            for description_short, state in messages
+        }
+    )
 
 
 def _format_cbs_report(
-    report: ConditionBasedService, unit_system: UnitSystem
+    service_type: str,
+    state: ConditionBasedServiceStatus,
+    due_date: datetime.datetime | None,
+    due_distance: ValueWithUnit,
+    length_unit: str,
 ) -> dict[str, Any]:
     result: dict[str, Any] = {}
-    service_type = report.service_type.lower()
-    result[service_type] = report.state.value
-    if report.due_date is not None:
-        result[f"{service_type}_date"] = report.due_date.strftime("%Y-%m-%d")
-    if report.due_distance.value and report.due_distance.unit:
+    service_type = service_type.lower()
+    result[service_type] = state.value
+    if due_date is not None:
+        result[f"{service_type}_date"] = due_date.strftime("%Y-%m-%d")
+    if due_distance.value and due_distance.unit:
         distance = round(
-            unit_system.length(
-                report.due_distance.value,
-                UNIT_MAP.get(report.due_distance.unit, report.due_distance.unit),
+            DistanceConverter.convert(
+                due_distance.value,
+                UNIT_MAP.get(due_distance.unit, due_distance.unit),
+                length_unit,
             )
         )
-        result[f"{service_type}_distance"] = f"{distance} {unit_system.length_unit}"
+        result[f"{service_type}_distance"] = f"{distance} {length_unit}"
     return result
 
 
@@ -117,14 +163,16 @@ class BMWBinarySensorEntityDescription(BinarySensorEntityDescription):
     """Describes BMW binary_sensor entity."""
 
     value_fn: Callable[[MyBMWVehicle], bool]
-    attr_fn: Callable[[MyBMWVehicle, UnitSystem], dict[str, Any]] | None = None
+    attr_fn: Callable[[MyBMWVehicle, UnitSystem], Mapping[str, Any]] | None = None
     is_available: Callable[[MyBMWVehicle], bool] = lambda v: v.is_lsc_enabled
+    state_group: str | None = None
 
 
 SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="lids",
         translation_key="lids",
+        state_group="doors_and_windows",
         device_class=BinarySensorDeviceClass.OPENING,
         # device class opening: On means open, Off means closed
         value_fn=lambda v: not v.doors_and_windows.all_lids_closed,
@@ -135,6 +183,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="windows",
         translation_key="windows",
+        state_group="doors_and_windows",
         device_class=BinarySensorDeviceClass.OPENING,
         # device class opening: On means open, Off means closed
         value_fn=lambda v: not v.doors_and_windows.all_windows_closed,
@@ -145,6 +194,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="door_lock_state",
         translation_key="door_lock_state",
+        state_group="doors_and_windows",
         device_class=BinarySensorDeviceClass.LOCK,
         # device class lock: On means unlocked, Off means locked
         # Possible values: LOCKED, SECURED, SELECTIVE_LOCKED, UNLOCKED
@@ -157,6 +207,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="condition_based_services",
         translation_key="condition_based_services",
+        state_group="condition_based_services",
         device_class=BinarySensorDeviceClass.PROBLEM,
         # device class problem: On means problem detected, Off means no problem
         value_fn=lambda v: v.condition_based_services.is_service_required,
@@ -165,6 +216,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="check_control_messages",
         translation_key="check_control_messages",
+        state_group="check_control_messages",
         device_class=BinarySensorDeviceClass.PROBLEM,
         # device class problem: On means problem detected, Off means no problem
         value_fn=lambda v: v.check_control_messages.has_check_control_messages,
@@ -174,6 +226,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="charging_status",
         translation_key="charging_status",
+        state_group="fuel_and_battery",
         device_class=BinarySensorDeviceClass.BATTERY_CHARGING,
         # device class power: On means power detected, Off means no power
         value_fn=lambda v: v.fuel_and_battery.charging_status == ChargingState.CHARGING,
@@ -182,6 +235,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="connection_status",
         translation_key="connection_status",
+        state_group="fuel_and_battery",
         device_class=BinarySensorDeviceClass.PLUG,
         value_fn=lambda v: v.fuel_and_battery.is_charger_connected,
         is_available=lambda v: v.has_electric_drivetrain,
@@ -189,6 +243,7 @@ SENSOR_TYPES: tuple[BMWBinarySensorEntityDescription, ...] = (
     BMWBinarySensorEntityDescription(
         key="is_pre_entry_climatization_enabled",
         translation_key="is_pre_entry_climatization_enabled",
+        state_group="charging_profile",
         value_fn=lambda v: v.charging_profile.is_pre_entry_climatization_enabled
         if v.charging_profile
         else False,
@@ -218,6 +273,7 @@ class BMWBinarySensor(BMWBaseEntity, BinarySensorEntity):
     """Representation of a BMW vehicle binary sensor."""
 
     entity_description: BMWBinarySensorEntityDescription
+    _extra_attributes: Mapping[str, Any] | None = None
 
     def __init__(
         self,
@@ -227,7 +283,7 @@ class BMWBinarySensor(BMWBaseEntity, BinarySensorEntity):
         unit_system: UnitSystem,
     ) -> None:
         """Initialize sensor."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.state_group)
         self.entity_description = description
         self._unit_system = unit_system
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
@@ -243,8 +299,13 @@ class BMWBinarySensor(BMWBaseEntity, BinarySensorEntity):
         self._attr_is_on = self.entity_description.value_fn(self.vehicle)
 
         if self.entity_description.attr_fn:
-            self._attr_extra_state_attributes = self.entity_description.attr_fn(
+            self._extra_attributes = self.entity_description.attr_fn(
                 self.vehicle, self._unit_system
             )
 
         super()._handle_coordinator_update()
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the attributes, which may be shared with other entities."""
+        return self._mark_stale(self._extra_attributes)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -17,12 +18,13 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommand
 from .entity import BMWBaseEntity
 
 if TYPE_CHECKING:
     from .coordinator import BMWDataUpdateCoordinator
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,6 +34,7 @@ class BMWButtonEntityDescription(ButtonEntityDescription):
     """Class describing BMW button entities."""
 
     remote_function: Callable[[MyBMWVehicle], Coroutine[Any, Any, RemoteServiceStatus]]
+    remote_command: RemoteCommand
     enabled_when_read_only: bool = False
     is_available: Callable[[MyBMWVehicle], bool] = lambda _: True
 
@@ -40,27 +43,32 @@ BUTTON_TYPES: tuple[BMWButtonEntityDescription, ...] = (
     BMWButtonEntityDescription(
         key="light_flash",
         translation_key="light_flash",
+        remote_command=RemoteCommand.LIGHT_FLASH,
         remote_function=lambda vehicle: vehicle.remote_services.trigger_remote_light_flash(),
     ),
     BMWButtonEntityDescription(
         key="sound_horn",
         translation_key="sound_horn",
+        remote_command=RemoteCommand.HORN,
         remote_function=lambda vehicle: vehicle.remote_services.trigger_remote_horn(),
     ),
     BMWButtonEntityDescription(
         key="activate_air_conditioning",
         translation_key="activate_air_conditioning",
+        remote_command=RemoteCommand.CLIMATE,
         remote_function=lambda vehicle: vehicle.remote_services.trigger_remote_air_conditioning(),
     ),
     BMWButtonEntityDescription(
         key="deactivate_air_conditioning",
         translation_key="deactivate_air_conditioning",
+        remote_command=RemoteCommand.CLIMATE,
         remote_function=lambda vehicle: vehicle.remote_services.trigger_remote_air_conditioning_stop(),
         is_available=lambda vehicle: vehicle.is_remote_climate_stop_enabled,
     ),
     BMWButtonEntityDescription(
         key="find_vehicle",
         translation_key="find_vehicle",
+        remote_command=RemoteCommand.VEHICLE_FINDER,
         remote_function=lambda vehicle: vehicle.remote_services.trigger_remote_vehicle_finder(),
     ),
 )
@@ -108,7 +116,11 @@ class BMWButton(BMWBaseEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Press the button."""
         try:
-            await self.entity_description.remote_function(self.vehicle)
+            await self.coordinator.async_execute_remote_command(
+                self.vehicle.vin,
+                self.entity_description.remote_command,
+                partial(self.entity_description.remote_function, self.vehicle),
+            )
         except MyBMWAPIError as ex:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
@@ -0,0 +1,263 @@
+"""Serialized execution of remote commands per vehicle."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from enum import IntEnum, StrEnum
+import heapq
+import itertools
+import logging
+from typing import Any
+
+from bimmer_connected.vehicle import MyBMWVehicle
+from bimmer_connected.vehicle.remote_services import (
+    RemoteServices,
+    RemoteServiceStatus,
+    Services,
+)
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RemoteCommand(StrEnum):
+    """Vehicle function changed by a remote command."""
+
+    CHARGING = "charging"
+    CHARGING_MODE = "charging_mode"
+    CHARGING_SETTINGS = "charging_settings"
+    CLIMATE = "climate"
+    DOOR_LOCK = "door_lock"
+    HORN = "horn"
+    LIGHT_FLASH = "light_flash"
+    SEND_POI = "send_poi"
+    VEHICLE_FINDER = "vehicle_finder"
+
+
+# Commands setting a state, a newer command of the same function replaces one
+# still waiting in the queue, e.g. climate off replaces climate on. Other
+# commands (e.g. two POIs or repeated horn presses) are all executed.
+SUPERSEDED_COMMANDS = frozenset(
+    {
+        RemoteCommand.CHARGING,
+        RemoteCommand.CHARGING_MODE,
+        RemoteCommand.CLIMATE,
+        RemoteCommand.DOOR_LOCK,
+    }
+)
+
+
+class CommandPriority(IntEnum):
+    """Order in which queued commands are executed."""
+
+    SAFETY = 0
+    CHARGING = 1
+    COMFORT = 2
+
+
+COMMAND_PRIORITIES = {
+    RemoteCommand.CHARGING: CommandPriority.CHARGING,
+    RemoteCommand.CHARGING_MODE: CommandPriority.CHARGING,
+    RemoteCommand.CHARGING_SETTINGS: CommandPriority.CHARGING,
+    RemoteCommand.CLIMATE: CommandPriority.COMFORT,
+    RemoteCommand.DOOR_LOCK: CommandPriority.SAFETY,
+    RemoteCommand.HORN: CommandPriority.COMFORT,
+    RemoteCommand.LIGHT_FLASH: CommandPriority.COMFORT,
+    RemoteCommand.SEND_POI: CommandPriority.COMFORT,
+    RemoteCommand.VEHICLE_FINDER: CommandPriority.COMFORT,
+}
+
+
+class RemoteCommandState(StrEnum):
+    """Progress of a remote command."""
+
+    PENDING = "pending"
+    EXECUTED = "executed"
+    FAILED = "failed"
+    SUPERSEDED = "superseded"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+
+
+@dataclass(frozen=True, kw_only=True)
+class RemoteCommandStatus:
+    """Status of the last remote command of a vehicle."""
+
+    command: RemoteCommand
+    state: RemoteCommandState
+    error: str | None = None
+
+
+class CommandSupersededError(HomeAssistantError):
+    """Error to indicate a queued command was replaced by a newer one."""
+
+
+@dataclass(order=True)
+class _QueuedCommand:
+    """Remote command waiting for execution."""
+
+    priority: CommandPriority
+    sequence: int
+    command: RemoteCommand = field(compare=False)
+    action: Callable[[], Awaitable[Any]] = field(compare=False)
+    future: asyncio.Future[Any] = field(compare=False)
+
+
+@dataclass
+class PendingChargingSettings:
+    """Charging settings changes waiting to be sent in one command."""
+
+    future: asyncio.Future[None]
+    settings: dict[str, int] = field(default_factory=dict)
+    in_target_state: dict[str, Callable[[], bool]] = field(default_factory=dict)
+    on_error: dict[str, Callable[[], None]] = field(default_factory=dict)
+
+
+class TargetedRefreshRemoteServices(RemoteServices):
+    """Remote services refreshing only the affected vehicle afterwards.
+
+    The library refreshes all vehicles of the account after commands that
+    change the vehicle state.
+    """
+
+    def __init__(
+        self,
+        vehicle: MyBMWVehicle,
+        refresh_vehicle: Callable[[str], Awaitable[None]],
+    ) -> None:
+        """Initialize the remote services of a vehicle."""
+        super().__init__(vehicle)
+        self._refresh_vehicle = refresh_vehicle
+
+    async def trigger_remote_service(
+        self,
+        service_id: Services,
+        params: dict | None = None,
+        data: Any = None,
+        refresh: bool = False,
+    ) -> RemoteServiceStatus:
+        """Trigger a remote service and refresh the vehicle if requested."""
+        status = await super().trigger_remote_service(
+            service_id, params=params, data=data, refresh=False
+        )
+        if refresh:
+            await self._refresh_vehicle(self._vehicle.vin)
+        return status
+
+
+class VehicleCommandExecutor:
+    """Execute the remote commands of a vehicle one after another.
+
+    Each vehicle has its own executor, so commands to different vehicles run
+    in parallel.
+
+    Safety commands (lock/unlock) are executed before charging and comfort
+    commands waiting in the queue.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, vin: str
+    ) -> None:
+        """Initialize the executor."""
+        self.hass = hass
+        self.config_entry = config_entry
+        self.vin = vin
+        self._queue: list[_QueuedCommand] = []
+        self._sequence = itertools.count()
+        self._running: _QueuedCommand | None = None
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of running and waiting commands."""
+        return len(self._queue) + (self._running is not None)
+
+    def has_command(self, command: RemoteCommand) -> bool:
+        """Return True if a command of the given type is running or waiting."""
+        return (self._running is not None and self._running.command is command) or any(
+            queued.command is command for queued in self._queue
+        )
+
+    @callback
+    def async_submit[_T](
+        self, command: RemoteCommand, action: Callable[[], Awaitable[_T]]
+    ) -> asyncio.Future[_T]:
+        """Queue a remote command and return a future of its result."""
+        if command in SUPERSEDED_COMMANDS:
+            self._supersede(command)
+
+        future: asyncio.Future[_T] = self.hass.loop.create_future()
+        heapq.heappush(
+            self._queue,
+            _QueuedCommand(
+                COMMAND_PRIORITIES[command],
+                next(self._sequence),
+                command,
+                action,
+                future,
+            ),
+        )
+        _LOGGER.debug(
+            "Queued '%s' command of %s, %s command(s) pending",
+            command,
+            self.vin,
+            self.queue_depth,
+        )
+
+        if self._worker is None or self._worker.done():
+            self._worker = self.config_entry.async_create_background_task(
+                self.hass, self._async_work(), f"{DOMAIN} commands {self.vin}"
+            )
+        return future
+
+    @callback
+    def _supersede(self, command: RemoteCommand) -> None:
+        """Drop the queued commands of the same function as a newer command."""
+        if not (superseded := [c for c in self._queue if c.command is command]):
+            return
+        _LOGGER.debug("Replacing queued '%s' command of %s", command, self.vin)
+        self._queue = [c for c in self._queue if c.command is not command]
+        heapq.heapify(self._queue)
+        for queued in superseded:
+            if not queued.future.done():
+                queued.future.set_exception(
+                    CommandSupersededError(
+                        translation_domain=DOMAIN,
+                        translation_key="remote_service_superseded",
+                    )
+                )
+
+    async def _async_work(self) -> None:
+        """Execute queued commands until the queue is empty."""
+        try:
+            while self._queue:
+                self._running = running = heapq.heappop(self._queue)
+                # The caller gave up waiting (e.g. timeout or cancellation)
+                if running.future.done():
+                    self._running = None
+                    continue
+                try:
+                    result = await running.action()
+                except Exception as err:  # noqa: BLE001
+                    if not running.future.done():
+                        running.future.set_exception(err)
+                else:
+                    if not running.future.done():
+                        running.future.set_result(result)
+                self._running = None
+        finally:
+            self._worker = None
+            # Commands left after a cancellation (e.g. on unload) never run
+            if self._running is not None:
+                self._running.future.cancel()
+                self._running = None
+            for queued in self._queue:
+                queued.future.cancel()
+            self._queue.clear()
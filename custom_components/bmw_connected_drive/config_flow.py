@@ -31,12 +31,16 @@ from homeassistant.util.ssl import get_default_context
 from . import DOMAIN
 from .const import (
     CONF_ALLOWED_REGIONS,
+    CONF_BACKGROUND_COMMANDS,
     CONF_CAPTCHA_REGIONS,
     CONF_CAPTCHA_TOKEN,
     CONF_CAPTCHA_URL,
+    CONF_COMMAND_REFRESH_DELAY,
     CONF_GCID,
     CONF_READ_ONLY,
     CONF_REFRESH_TOKEN,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    DEFAULT_COMMAND_REFRESH_DELAY,
 )
 from .coordinator import BMWConfigEntry
 
@@ -260,6 +264,24 @@ class BMWOptionsFlow(OptionsFlow):
                         CONF_READ_ONLY,
                         default=self.config_entry.options.get(CONF_READ_ONLY, False),
                     ): bool,
+                    vol.Optional(
+                        CONF_BACKGROUND_COMMANDS,
+                        default=self.config_entry.options.get(
+                            CONF_BACKGROUND_COMMANDS, False
+                        ),
+                    ): bool,
+                    vol.Optional(
+                        CONF_COMMAND_REFRESH_DELAY,
+                        default=self.config_entry.options.get(
+                            CONF_COMMAND_REFRESH_DELAY, DEFAULT_COMMAND_REFRESH_DELAY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=300)),
+                    vol.Optional(
+                        CONF_SKIP_REDUNDANT_COMMANDS,
+                        default=self.config_entry.options.get(
+                            CONF_SKIP_REDUNDANT_COMMANDS, False
+                        ),
+                    ): bool,
                 }
             ),
         )
@@ -1,15 +1,22 @@
 """Const file for the MyBMW integration."""
 
+from bimmer_connected.vehicle.doors_windows import LockState
+
 from homeassistant.const import UnitOfLength, UnitOfVolume
 
 DOMAIN = "bmw_connected_drive"
 
 ATTR_DIRECTION = "direction"
+# Set while the shown vehicle data was restored from the last snapshot
+ATTR_STALE = "stale"
 ATTR_VIN = "vin"
 
 CONF_ALLOWED_REGIONS = ["china", "north_america", "rest_of_world"]
 CONF_CAPTCHA_REGIONS = ["north_america", "rest_of_world"]
 CONF_READ_ONLY = "read_only"
+CONF_BACKGROUND_COMMANDS = "background_commands"
+CONF_COMMAND_REFRESH_DELAY = "command_refresh_delay"
+CONF_SKIP_REDUNDANT_COMMANDS = "skip_redundant_commands"
 CONF_ACCOUNT = "account"
 CONF_REFRESH_TOKEN = "refresh_token"
 CONF_GCID = "gcid"
@@ -20,6 +27,11 @@ CONF_CAPTCHA_URL = (
 
 DATA_HASS_CONFIG = "hass_config"
 
+EVENT_REMOTE_COMMAND = f"{DOMAIN}_remote_command"
+SIGNAL_REMOTE_COMMAND = f"{DOMAIN}_remote_command_{{vin}}"
+
+LOCKED_STATES = {LockState.LOCKED, LockState.SECURED}
+
 UNIT_MAP = {
     "KILOMETERS": UnitOfLength.KILOMETERS,
     "MILES": UnitOfLength.MILES,
@@ -27,6 +39,9 @@ UNIT_MAP = {
     "GALLONS": UnitOfVolume.GALLONS,
 }
 
+# Seconds between a remote command and the refresh of the affected vehicle
+DEFAULT_COMMAND_REFRESH_DELAY = 7
+
 SCAN_INTERVALS = {
     "china": 300,
     "north_america": 600,
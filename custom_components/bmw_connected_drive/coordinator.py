@@ -2,34 +2,152 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import suppress
+from datetime import datetime, timedelta
+from enum import Enum
+from functools import partial
+from json import JSONDecodeError
 import logging
+import random
+from typing import Any
 
 from bimmer_connected.account import MyBMWAccount
 from bimmer_connected.api.regions import get_region_from_name
+from bimmer_connected.const import ATTR_CAPABILITIES
+from bimmer_connected.vehicle import MyBMWVehicle
 from bimmer_connected.models import (
+    AnonymizedResponse,
     GPSPosition,
     MyBMWAPIError,
     MyBMWAuthError,
     MyBMWCaptchaMissingError,
+    MyBMWQuotaError,
 )
 from httpx import RequestError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.const import (
+    CONF_PASSWORD,
+    CONF_REGION,
+    CONF_USERNAME,
+    EVENT_HOMEASSISTANT_STOP,
+)
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, HomeAssistantError
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 from homeassistant.util.ssl import get_default_context
 
-from .const import CONF_GCID, CONF_READ_ONLY, CONF_REFRESH_TOKEN, DOMAIN, SCAN_INTERVALS
+from .commands import (
+    CommandSupersededError,
+    PendingChargingSettings,
+    RemoteCommand,
+    RemoteCommandState,
+    RemoteCommandStatus,
+    TargetedRefreshRemoteServices,
+    VehicleCommandExecutor,
+)
+from .const import (
+    CONF_BACKGROUND_COMMANDS,
+    CONF_COMMAND_REFRESH_DELAY,
+    CONF_GCID,
+    CONF_READ_ONLY,
+    CONF_REFRESH_TOKEN,
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    DOMAIN,
+    EVENT_REMOTE_COMMAND,
+    SCAN_INTERVALS,
+    SIGNAL_REMOTE_COMMAND,
+)
+from .quota import (
+    REQUESTS_PER_REMOTE_SERVICE,
+    RequestBudget,
+    daily_request_budget,
+    estimate_poll_requests,
+)
+from .scheduler import (
+    BreakerState,
+    PollCircuitBreaker,
+    VehiclePollScheduler,
+    get_poll_stagger,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10
+# Refresh token rotations within this window are written to the entry once
+REFRESH_TOKEN_SAVE_COOLDOWN = 600
+# The access token is refreshed in the background this long before it expires
+TOKEN_REFRESH_AHEAD = timedelta(minutes=5)
+TOKEN_REFRESH_JITTER = timedelta(minutes=1)
+TOKEN_REFRESH_RETRY = timedelta(minutes=1)
+# Requested refreshes of a vehicle within this window are merged into one
+VEHICLE_REFRESH_COOLDOWN = 60
+# Commands are only skipped as redundant if the vehicle state is this recent
+REDUNDANT_COMMAND_MAX_AGE = timedelta(minutes=5)
+# Charging settings changed within this many seconds are sent in one command
+CHARGING_SETTINGS_DEBOUNCE = 3
+
+# Vehicle attributes that are fingerprinted to detect changes between polls
+VEHICLE_STATE_GROUPS = (
+    "capabilities",
+    "charging_profile",
+    "check_control_messages",
+    "climate",
+    "condition_based_services",
+    "doors_and_windows",
+    "fuel_and_battery",
+    "mileage",
+    "tires",
+    "vehicle_location",
+)
+# State groups that may change without a new timestamp of the vehicle state,
+# e.g. charging settings are fetched separately
+UNTIMESTAMPED_STATE_GROUPS = ("capabilities", "charging_profile")
+
+
+def _freeze(value: Any) -> Any:
+    """Convert vehicle data to a hashable structure."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return tuple((k, _freeze(v)) for k, v in value.items())
+    if hasattr(value, "__dict__") and not isinstance(value, Enum):
+        return (type(value).__name__, _freeze(vars(value)))
+    return value
+
+
+def _state_group_data(vehicle: MyBMWVehicle, group: str) -> Any:
+    """Return the data of a state group of a vehicle."""
+    # Capabilities are not parsed into an attribute of the vehicle
+    if group == "capabilities":
+        return vehicle.data[ATTR_CAPABILITIES]
+    return getattr(vehicle, group)
+
+
+def _fingerprint_vehicle(
+    vehicle: MyBMWVehicle, groups: Iterable[str] = VEHICLE_STATE_GROUPS
+) -> dict[str, int]:
+    """Return a fingerprint for the state groups of a vehicle."""
+    return {group: hash(_freeze(_state_group_data(vehicle, group))) for group in groups}
+
 
 type BMWConfigEntry = ConfigEntry[BMWDataUpdateCoordinator]
 
 
+def get_snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last known vehicle data of an account."""
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
 class BMWDataUpdateCoordinator(DataUpdateCoordinator[None]):
     """Class to manage fetching BMW data."""
 
@@ -46,6 +164,13 @@ class BMWDataUpdateCoordinator(DataUpdateCoordinator[None]):
             verify=get_default_context(),
         )
         self.read_only: bool = config_entry.options[CONF_READ_ONLY]
+        self.background_commands: bool = config_entry.options[CONF_BACKGROUND_COMMANDS]
+        self.command_refresh_delay: int = config_entry.options[
+            CONF_COMMAND_REFRESH_DELAY
+        ]
+        self.skip_redundant_commands: bool = config_entry.options[
+            CONF_SKIP_REDUNDANT_COMMANDS
+        ]
 
         if CONF_REFRESH_TOKEN in config_entry.data:
             self.account.set_refresh_token(
@@ -53,16 +178,65 @@ class BMWDataUpdateCoordinator(DataUpdateCoordinator[None]):
                 gcid=config_entry.data.get(CONF_GCID),
             )
 
+        scan_interval = timedelta(
+            seconds=SCAN_INTERVALS[config_entry.data[CONF_REGION]]
+        )
+        self.scheduler = VehiclePollScheduler(scan_interval)
+        self.breaker = PollCircuitBreaker(scan_interval)
+        self._stagger = get_poll_stagger(hass)
+        self._stagger.register(config_entry.entry_id, self.scheduler)
+        # The phase of the account is set after its first poll
+        self._stagger_pending = True
+        # Sized for the vehicles of the account once they are known
+        self.quota = RequestBudget(
+            daily_request_budget(0, scan_interval), dt_util.utcnow()
+        )
+
+        self._fingerprints: dict[str, tuple[datetime | None, dict[str, int]]] = {}
+        self._changes: dict[str, set[str]] | None = None
+        self._vehicle_listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, Any]] = {}
+
+        self._snapshot_store = get_snapshot_store(hass, config_entry.entry_id)
+        # True while entities show vehicle data restored from the snapshot
+        self.is_stale = False
+
         super().__init__(
             hass,
             _LOGGER,
             config_entry=config_entry,
             name=f"{DOMAIN}-{config_entry.data[CONF_USERNAME]}",
-            update_interval=timedelta(
-                seconds=SCAN_INTERVALS[config_entry.data[CONF_REGION]]
-            ),
+            update_interval=scan_interval,
         )
 
+        self._pending_refresh_token: str | None = None
+        self._refresh_token_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=REFRESH_TOKEN_SAVE_COOLDOWN,
+            immediate=True,
+            function=self._async_save_refresh_token,
+        )
+        config_entry.async_on_unload(
+            hass.bus.async_listen(EVENT_HOMEASSISTANT_STOP, self._async_handle_stop)
+        )
+        self._unsub_token_refresh: CALLBACK_TYPE | None = None
+
+        # Fetch of all vehicles shared by concurrent callers
+        self._fetch: asyncio.Task[None] | None = None
+        self._fetch_logs_responses = False
+        self._last_fetch: tuple[datetime, bool] | None = None
+        # Responses of the last fetch with log_responses
+        self._logged_responses: list[AnonymizedResponse] = []
+
+        self._command_executors: dict[str, VehicleCommandExecutor] = {}
+        self._vehicle_refresh_debouncers: dict[str, Debouncer] = {}
+        self._vehicle_refresh_errors: dict[str, HomeAssistantError] = {}
+        self.command_status: dict[str, RemoteCommandStatus] = {}
+        # Last time a command of each type was queued per vehicle
+        self._command_times: dict[tuple[str, RemoteCommand], datetime] = {}
+        self._charging_settings: dict[str, PendingChargingSettings] = {}
+        self._device_infos: dict[str, DeviceInfo] = {}
+
         # Default to false on init so _async_update_data logic works
         self.last_update_success = False
 
@@ -70,8 +244,41 @@ class BMWDataUpdateCoordinator(DataUpdateCoordinator[None]):
         """Fetch data from BMW."""
         old_refresh_token = self.account.refresh_token
 
+        now = dt_util.utcnow()
+        all_vins = {vehicle.vin for vehicle in self.account.vehicles}
+        # Refreshes outside of the schedule (e.g. manual ones) fetch all vehicles
+        due_vins = self.scheduler.due_vins(now) or all_vins
+
+        full_update = not self.account.vehicles or due_vins >= all_vins
+
+        if all_vins and not self.quota.can_poll(
+            estimate_poll_requests(len(due_vins)), now
+        ):
+            _LOGGER.warning(
+                "Skipping update of %s, API request budget is exhausted", self.name
+            )
+            self.scheduler.reschedule(
+                due_vins, now, self.quota.poll_interval_factor(now)
+            )
+            self.update_interval = self.scheduler.next_update_interval(now)
+            self._changes = {}
+            return
+
+        self.breaker.before_poll(now)
+        if self.breaker.state is BreakerState.OPEN:
+            # Refreshes outside of the schedule (e.g. manual ones) wait for the
+            # probe poll at the end of the backoff
+            self.update_interval = self.breaker.retry_delay(now)
+            raise UpdateFailed(
+                translation_domain=DOMAIN,
+                translation_key="api_backoff",
+            )
         try:
-            await self.account.get_vehicles()
+            if full_update:
+                await self.async_fetch_vehicles()
+            else:
+                async with self._stagger.fetch_semaphore:
+                    await self._async_update_vehicle_states(due_vins)
         except MyBMWCaptchaMissingError as err:
             # If a captcha is required (user/password login flow), always trigger the reauth flow
             raise ConfigEntryAuthFailed(
@@ -87,20 +294,695 @@ class BMWDataUpdateCoordinator(DataUpdateCoordinator[None]):
                     translation_placeholders={"exception": str(err)},
                 ) from err
             # Clear refresh token and trigger reauth if previous update failed as well
+            self._refresh_token_debouncer.async_cancel()
+            self._pending_refresh_token = None
             self._update_config_entry_refresh_token(None)
             raise ConfigEntryAuthFailed(
                 translation_domain=DOMAIN,
                 translation_key="invalid_auth",
             ) from err
         except (MyBMWAPIError, RequestError) as err:
+            if isinstance(err, MyBMWQuotaError):
+                self.quota.exhaust(now)
+            self.breaker.record_failure(now)
             raise UpdateFailed(
                 translation_domain=DOMAIN,
                 translation_key="update_failed",
                 translation_placeholders={"exception": str(err)},
             ) from err
+        finally:
+            if not full_update:
+                self.quota.consume(estimate_poll_requests(len(due_vins)), now)
+            self._async_schedule_vehicles(None if full_update else due_vins, now)
+            if (retry_delay := self.breaker.retry_delay(now)) is not None:
+                self.update_interval = max(self.update_interval, retry_delay)
+
+        self.breaker.record_success()
+        changes = self._async_diff_vehicles(
+            v for v in self.account.vehicles if full_update or v.vin in due_vins
+        )
+        # Availability changes if the previous update failed, so notify everyone
+        self._changes = changes if self.last_update_success else None
+
+        if self.is_stale:
+            _LOGGER.debug("Replaced restored vehicle data of %s", self.name)
+            self.is_stale = False
+            # All entities drop their stale attribute
+            self._changes = None
+        if changes:
+            self._snapshot_store.async_delay_save(
+                self._async_snapshot_data, SNAPSHOT_SAVE_DELAY
+            )
 
         if self.account.refresh_token != old_refresh_token:
-            self._update_config_entry_refresh_token(self.account.refresh_token)
+            await self._async_store_refresh_token()
+
+        if self._unsub_token_refresh is None:
+            self._async_schedule_token_refresh()
+
+    async def async_fetch_vehicles(
+        self, *, log_responses: bool = False, max_age: timedelta = timedelta(0)
+    ) -> None:
+        """Fetch all vehicles, sharing the fetch with concurrent callers.
+
+        Data fetched within `max_age` is reused. With `log_responses`, the
+        vehicle list is fetched again and the responses are kept for
+        diagnostics, see get_logged_responses.
+        """
+        while True:
+            if (last_fetch := self._last_fetch) is not None and (
+                dt_util.utcnow() - last_fetch[0] <= max_age
+                and (last_fetch[1] or not log_responses)
+            ):
+                return
+            if self._fetch is None:
+                break
+            if self._fetch_logs_responses or not log_responses:
+                await asyncio.shield(self._fetch)
+                return
+            # Wait for the running fetch, the next one logs the responses
+            with suppress(MyBMWAPIError, RequestError, JSONDecodeError):
+                await asyncio.shield(self._fetch)
+
+        self._fetch_logs_responses = log_responses
+        self._fetch = self.hass.async_create_task(
+            self._async_fetch_vehicles(log_responses),
+            f"{self.name} fetch vehicles",
+            eager_start=False,
+        )
+        await asyncio.shield(self._fetch)
+
+    async def _async_fetch_vehicles(self, log_responses: bool) -> None:
+        """Fetch the vehicle list (if required) and the state of all vehicles."""
+        # Vehicles restored from the snapshot may have been added or removed
+        vehicle_list = log_responses or self.is_stale or not self.account.vehicles
+        self.account.config.log_responses = log_responses
+        try:
+            async with self._stagger.fetch_semaphore:
+                if self.is_stale:
+                    await self._async_replace_restored_vehicles()
+                else:
+                    await self.account.get_vehicles(force_init=log_responses)
+        finally:
+            self.account.config.log_responses = False
+            if log_responses:
+                # The library keeps the responses in a store shared by all
+                # accounts and empties it when they are read
+                self._logged_responses = self.account.get_stored_responses()
+            self._fetch = None
+            now = dt_util.utcnow()
+            self.quota.resize(
+                daily_request_budget(
+                    len(self.account.vehicles), self.scheduler.base_interval
+                ),
+                now,
+            )
+            self.quota.consume(
+                estimate_poll_requests(
+                    len(self.account.vehicles), vehicle_list=vehicle_list
+                ),
+                now,
+            )
+            self._async_setup_remote_services()
+        self._last_fetch = (dt_util.utcnow(), log_responses)
+
+    def get_logged_responses(self) -> list[AnonymizedResponse]:
+        """Return the responses of the last fetch with `log_responses`."""
+        return list(self._logged_responses)
+
+    async def _async_replace_restored_vehicles(self) -> None:
+        """Fetch the vehicle list again and update the restored vehicles.
+
+        Entities keep the restored vehicle objects, so vehicles still part of
+        the account are updated in place. The config entry is reloaded if
+        vehicles were added or removed.
+        """
+        restored = {vehicle.vin: vehicle for vehicle in self.account.vehicles}
+        self.account.vehicles.clear()
+        try:
+            await self.account.get_vehicles(force_init=True)
+        except BaseException:
+            self.account.vehicles[:] = restored.values()
+            raise
+
+        vehicles: list[MyBMWVehicle] = []
+        for fetched in self.account.vehicles:
+            if (known := restored.get(fetched.vin)) is not None:
+                known.update_state(fetched.data, fetched.data["fetched_at"])
+                vehicles.append(known)
+            else:
+                vehicles.append(fetched)
+        self.account.vehicles[:] = vehicles
+
+        if {vehicle.vin for vehicle in vehicles} != restored.keys():
+            _LOGGER.debug("Vehicles of %s changed, reloading", self.name)
+            await self._snapshot_store.async_save(self._async_snapshot_data())
+            self.hass.config_entries.async_schedule_reload(self.config_entry.entry_id)
+
+    @callback
+    def _async_setup_remote_services(self) -> None:
+        """Let remote commands refresh only the vehicle they were sent to."""
+        for vehicle in self.account.vehicles:
+            if not isinstance(vehicle.remote_services, TargetedRefreshRemoteServices):
+                vehicle.remote_services = TargetedRefreshRemoteServices(
+                    vehicle, self._async_refresh_vehicle
+                )
+
+    async def _async_refresh_vehicle(self, vin: str) -> None:
+        """Fetch the state of a vehicle changed by a remote command.
+
+        The requests are counted by async_consume_command_budget.
+        """
+        await asyncio.sleep(self.command_refresh_delay)
+        if not self.breaker.is_closed:
+            # The next poll catches up once the API works again
+            _LOGGER.debug("Not refreshing vehicle %s, polls are backing off", vin)
+            return
+        try:
+            # Entities are updated by the command caller
+            await self._async_update_vehicle(vin)
+        except (MyBMWAPIError, JSONDecodeError, RequestError) as err:
+            # The command itself succeeded, the next poll catches up
+            _LOGGER.warning("Unable to refresh vehicle %s: %s", vin, err)
+
+    async def async_request_vehicle_refresh(self, vin: str) -> None:
+        """Refresh a single vehicle on request.
+
+        The first request is executed right away, further requests within the
+        cooldown are merged into one refresh at its end. Errors of a refresh
+        executed right away are raised.
+        """
+        if (debouncer := self._vehicle_refresh_debouncers.get(vin)) is None:
+            debouncer = self._vehicle_refresh_debouncers[vin] = Debouncer(
+                self.hass,
+                _LOGGER,
+                cooldown=VEHICLE_REFRESH_COOLDOWN,
+                immediate=True,
+                function=partial(self._async_debounced_vehicle_refresh, vin),
+            )
+        self._vehicle_refresh_errors.pop(vin, None)
+        await debouncer.async_call()
+        if (err := self._vehicle_refresh_errors.pop(vin, None)) is not None:
+            raise err
+
+    async def _async_debounced_vehicle_refresh(self, vin: str) -> None:
+        """Refresh a single vehicle, keeping an error for the requester.
+
+        Errors are not raised, so the debouncer keeps its cooldown after them.
+        """
+        try:
+            await self._async_refresh_requested_vehicle(vin)
+        except HomeAssistantError as err:
+            _LOGGER.debug("Unable to refresh vehicle %s: %s", vin, err)
+            self._vehicle_refresh_errors[vin] = err
+
+    async def _async_refresh_requested_vehicle(self, vin: str) -> None:
+        """Refresh a single vehicle if the API works and the budget allows it."""
+        if not self.breaker.is_closed:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="api_backoff",
+            )
+        now = dt_util.utcnow()
+        requests = estimate_poll_requests(1)
+        if not self.quota.can_poll(requests, now):
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="quota_exhausted",
+            )
+        try:
+            changes = await self._async_update_vehicle(vin)
+        except (MyBMWAPIError, JSONDecodeError, RequestError) as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="update_failed",
+                translation_placeholders={"exception": str(err)},
+            ) from err
+        finally:
+            self.quota.consume(requests, now)
+        self._changes = changes
+        self.async_update_listeners()
+
+    async def _async_update_vehicle(self, vin: str) -> dict[str, set[str]]:
+        """Fetch the state of a single vehicle outside of the poll schedule."""
+        now = dt_util.utcnow()
+        async with self._stagger.fetch_semaphore:
+            await self._async_update_vehicle_states({vin})
+
+        changes = self._async_diff_vehicles(
+            v for v in self.account.vehicles if v.vin == vin
+        )
+        if changes:
+            self._snapshot_store.async_delay_save(
+                self._async_snapshot_data, SNAPSHOT_SAVE_DELAY
+            )
+        self._async_schedule_vehicles({vin}, now)
+        return changes
+
+    def get_command_executor(self, vin: str) -> VehicleCommandExecutor:
+        """Return the remote command executor of a vehicle."""
+        if (executor := self._command_executors.get(vin)) is None:
+            executor = self._command_executors[vin] = VehicleCommandExecutor(
+                self.hass, self.config_entry, vin
+            )
+        return executor
+
+    def get_device_info(self, vehicle: MyBMWVehicle) -> DeviceInfo:
+        """Return the device info of a vehicle.
+
+        The same object is shared by all entities of the vehicle and must not
+        be modified.
+        """
+        if (device_info := self._device_infos.get(vehicle.vin)) is None:
+            device_info = self._device_infos[vehicle.vin] = DeviceInfo(
+                identifiers={(DOMAIN, vehicle.vin)},
+                manufacturer=vehicle.brand.name,
+                model=vehicle.name,
+                name=vehicle.name,
+                serial_number=vehicle.vin,
+            )
+        return device_info
+
+    def command_queue_depth(self, vin: str) -> int:
+        """Return the number of running and waiting remote commands of a vehicle."""
+        if (executor := self._command_executors.get(vin)) is None:
+            return 0
+        return executor.queue_depth
+
+    @callback
+    def async_skip_redundant_command(
+        self, vin: str, command: RemoteCommand, in_target_state: Callable[[], bool]
+    ) -> bool:
+        """Skip a command if the vehicle is already in its target state.
+
+        Only if enabled in the options and the vehicle state was fetched
+        recently, after the last command of the same type.
+        """
+        if not self.skip_redundant_commands or self.is_stale:
+            return False
+        if (
+            vehicle := self.account.get_vehicle(vin)
+        ) is None or self.get_command_executor(vin).has_command(command):
+            return False
+        fetched_at: datetime = vehicle.data["fetched_at"]
+        if dt_util.utcnow() - fetched_at > REDUNDANT_COMMAND_MAX_AGE or (
+            (last_command := self._command_times.get((vin, command))) is not None
+            and last_command >= fetched_at
+        ):
+            return False
+        if not in_target_state():
+            return False
+
+        _LOGGER.debug("Skipping '%s' command of %s, already done", command, vin)
+        self._async_report_command(
+            vin, RemoteCommandStatus(command=command, state=RemoteCommandState.SKIPPED)
+        )
+        return True
+
+    async def async_execute_remote_command[_T](
+        self,
+        vin: str,
+        command: RemoteCommand,
+        action: Callable[[], Awaitable[_T]],
+        *,
+        in_target_state: Callable[[], bool] | None = None,
+        on_error: Callable[[], None] | None = None,
+    ) -> _T | None:
+        """Queue a remote command of a vehicle.
+
+        Waits for the result, unless commands run in the background. Then the
+        command is only queued and its outcome reported by an event and the
+        command status of the vehicle.
+
+        Commands are not sent if `in_target_state` reports that the vehicle is
+        already in the state the command would set, see
+        async_skip_redundant_command. `on_error` is called if the command
+        fails or is cancelled, e.g. to discard an optimistic state.
+        """
+        if in_target_state is not None and self.async_skip_redundant_command(
+            vin, command, in_target_state
+        ):
+            return None
+
+        async def _async_execute() -> _T:
+            self.async_consume_command_budget()
+            return await action()
+
+        future = self.get_command_executor(vin).async_submit(command, _async_execute)
+        self._command_times[(vin, command)] = dt_util.utcnow()
+        self._async_set_command_status(
+            vin, RemoteCommandStatus(command=command, state=RemoteCommandState.PENDING)
+        )
+        future.add_done_callback(
+            lambda future: self._async_command_done(vin, command, future, on_error)
+        )
+        if self.background_commands:
+            return None
+        return await future
+
+    async def async_update_charging_settings(
+        self,
+        vehicle: MyBMWVehicle,
+        setting: str,
+        value: int,
+        in_target_state: Callable[[], bool],
+        on_error: Callable[[], None] | None = None,
+    ) -> None:
+        """Change a charging setting (target SoC or AC limit) of a vehicle.
+
+        Only the last value of each setting changed within the debounce window
+        is sent, all changes of the window in a single command. Callers wait
+        for the result of that command. `on_error` is called if the command
+        fails, see async_execute_remote_command.
+        """
+        if (pending := self._charging_settings.get(vehicle.vin)) is None:
+            pending = self._charging_settings[vehicle.vin] = PendingChargingSettings(
+                self.hass.loop.create_future()
+            )
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_send_charging_settings(vehicle, pending),
+                f"{DOMAIN} charging settings {vehicle.vin}",
+            )
+        pending.settings[setting] = value
+        pending.in_target_state[setting] = in_target_state
+        if on_error is not None:
+            pending.on_error[setting] = on_error
+        await asyncio.shield(pending.future)
+
+    async def _async_send_charging_settings(
+        self, vehicle: MyBMWVehicle, pending: PendingChargingSettings
+    ) -> None:
+        """Send the charging settings changed within the debounce window."""
+        try:
+            await asyncio.sleep(CHARGING_SETTINGS_DEBOUNCE)
+        except asyncio.CancelledError:
+            pending.future.cancel()
+            raise
+        finally:
+            # Later changes start a new window
+            del self._charging_settings[vehicle.vin]
+
+        _LOGGER.debug(
+            "Updating charging settings of %s: %s", vehicle.name, pending.settings
+        )
+
+        @callback
+        def _async_on_error() -> None:
+            for on_error in pending.on_error.values():
+                on_error()
+
+        try:
+            await self.async_execute_remote_command(
+                vehicle.vin,
+                RemoteCommand.CHARGING_SETTINGS,
+                partial(
+                    vehicle.remote_services.trigger_charging_settings_update,
+                    **pending.settings,
+                ),
+                in_target_state=lambda: all(
+                    check() for check in pending.in_target_state.values()
+                ),
+                on_error=_async_on_error,
+            )
+        except Exception as err:  # noqa: BLE001
+            pending.future.set_exception(err)
+            # All callers may be gone, don't log the error as never retrieved
+            pending.future.exception()
+        else:
+            pending.future.set_result(None)
+
+    @callback
+    def _async_command_done(
+        self,
+        vin: str,
+        command: RemoteCommand,
+        future: asyncio.Future[Any],
+        on_error: Callable[[], None] | None,
+    ) -> None:
+        """Report the outcome of a remote command."""
+        error: str | None = None
+        if future.cancelled():
+            state = RemoteCommandState.CANCELLED
+        elif isinstance(err := future.exception(), CommandSupersededError):
+            state = RemoteCommandState.SUPERSEDED
+        elif err is not None:
+            state = RemoteCommandState.FAILED
+            error = str(err)
+        else:
+            state = RemoteCommandState.EXECUTED
+
+        status = RemoteCommandStatus(command=command, state=state, error=error)
+        self._async_report_command(vin, status)
+        if on_error is not None and state in (
+            RemoteCommandState.FAILED,
+            RemoteCommandState.CANCELLED,
+        ):
+            on_error()
+        if self.background_commands and state is RemoteCommandState.EXECUTED:
+            # The vehicle of the command was refreshed after it, see
+            # _async_refresh_vehicle
+            self.async_update_listeners()
+
+    @callback
+    def _async_report_command(self, vin: str, status: RemoteCommandStatus) -> None:
+        """Fire the event of a finished remote command and store its status."""
+        self.hass.bus.async_fire(
+            EVENT_REMOTE_COMMAND,
+            {
+                "vin": vin,
+                "command": status.command.value,
+                "state": status.state.value,
+                "error": status.error,
+            },
+        )
+        # A superseded command does not replace the status of its successor
+        if status.state is not RemoteCommandState.SUPERSEDED:
+            self._async_set_command_status(vin, status)
+
+    @callback
+    def _async_set_command_status(self, vin: str, status: RemoteCommandStatus) -> None:
+        """Store the command status of a vehicle and notify its entities."""
+        self.command_status[vin] = status
+        async_dispatcher_send(self.hass, SIGNAL_REMOTE_COMMAND.format(vin=vin), status)
+
+    @callback
+    def async_consume_command_budget(self) -> None:
+        """Count a remote command and the refresh of the vehicle following it.
+
+        Remote commands may use the budget reserved from polling.
+        """
+        now = dt_util.utcnow()
+        requests = REQUESTS_PER_REMOTE_SERVICE + estimate_poll_requests(1)
+        if not self.quota.can_command(requests, now):
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="quota_exhausted",
+            )
+        self.quota.consume(requests, now)
+
+    async def async_restore_snapshot(self) -> bool:
+        """Restore vehicles from the last known state and mark them as stale."""
+        if not (snapshot := await self._snapshot_store.async_load()):
+            return False
+
+        for vehicle_data in snapshot["vehicles"]:
+            fetched_at = dt_util.parse_datetime(vehicle_data["fetched_at"])
+            vehicle = MyBMWVehicle(self.account, vehicle_data, fetched_at)
+            vehicle.update_state(vehicle_data, fetched_at)
+            self.account.vehicles.append(vehicle)
+
+        _LOGGER.debug(
+            "Restored %s vehicle(s) of %s from snapshot",
+            len(self.account.vehicles),
+            self.name,
+        )
+        self._async_setup_remote_services()
+        self.is_stale = True
+        self.last_update_success = True
+        return True
+
+    @callback
+    def _async_snapshot_data(self) -> dict[str, Any]:
+        """Return the vehicle list, capabilities and last state to store."""
+        return {
+            "vehicles": [
+                {**vehicle.data, "fetched_at": vehicle.data["fetched_at"].isoformat()}
+                for vehicle in self.account.vehicles
+            ]
+        }
+
+    @callback
+    def _async_diff_vehicles(
+        self, vehicles: Iterable[MyBMWVehicle]
+    ) -> dict[str, set[str]]:
+        """Return the changed state groups of each vehicle since the last poll."""
+        changes: dict[str, set[str]] = {}
+        for vehicle in vehicles:
+            timestamp = vehicle.timestamp
+            previous = self._fingerprints.get(vehicle.vin)
+            if previous and timestamp is not None and previous[0] == timestamp:
+                # Only data outside of the vehicle state can have changed if
+                # the vehicle did not report new data
+                fingerprint = previous[1] | _fingerprint_vehicle(
+                    vehicle, UNTIMESTAMPED_STATE_GROUPS
+                )
+            else:
+                fingerprint = _fingerprint_vehicle(vehicle)
+            self._fingerprints[vehicle.vin] = (timestamp, fingerprint)
+            if changed := {
+                group
+                for group in VEHICLE_STATE_GROUPS
+                if not previous or previous[1][group] != fingerprint[group]
+            }:
+                changes[vehicle.vin] = changed
+        return changes
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        Entities pass ``(vin, state_groups)`` as context to only be notified
+        if one of these parts of the vehicle state changed.
+        """
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._vehicle_listeners[remove_listener] = (update_callback, context)
+
+        @callback
+        def remove_vehicle_listener() -> None:
+            self._vehicle_listeners.pop(remove_listener, None)
+            remove_listener()
+
+        return remove_vehicle_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners of changed vehicle data, or all listeners."""
+        changes, self._changes = self._changes, None
+        if changes is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._vehicle_listeners.values()):
+            if not isinstance(context, tuple):
+                update_callback()
+                continue
+            vin, state_groups = context
+            if vin in changes and (
+                state_groups is None or not changes[vin].isdisjoint(state_groups)
+            ):
+                update_callback()
+
+    async def _async_update_vehicle_states(self, vins: set[str]) -> None:
+        """Fetch the state of the given vehicles only."""
+        vehicles = [v for v in self.account.vehicles if v.vin in vins]
+        error_count = 0
+        for vehicle in vehicles:
+            try:
+                await vehicle.get_vehicle_state()
+            except (MyBMWAPIError, JSONDecodeError) as err:
+                # Same handling as MyBMWAccount.get_vehicles(): only fail if
+                # all vehicles fail or on errors affecting the whole account
+                if isinstance(err, (MyBMWQuotaError, MyBMWAuthError)):
+                    raise
+                error_count += 1
+                _LOGGER.error(
+                    "Unable to get details for vehicle %s - (%s) %s",
+                    vehicle.vin,
+                    type(err).__name__,
+                    err,
+                )
+                if error_count == len(vehicles):
+                    raise
+
+    @callback
+    def _async_schedule_vehicles(self, vins: set[str] | None, now: datetime) -> None:
+        """Schedule the next poll of the given (or all) vehicles."""
+        vehicles = [v for v in self.account.vehicles if vins is None or v.vin in vins]
+        self.scheduler.remove_missing(v.vin for v in self.account.vehicles)
+        self.scheduler.observe(vehicles, now)
+        self.scheduler.reschedule(
+            (v.vin for v in vehicles), now, self.quota.poll_interval_factor(now)
+        )
+        if self._stagger_pending and vehicles:
+            self.scheduler.delay(self._stagger.phase_delay(self.config_entry.entry_id))
+            self._stagger_pending = False
+        self.update_interval = self.scheduler.next_update_interval(now)
+
+    @callback
+    def _async_schedule_token_refresh(self) -> None:
+        """Schedule the refresh of the access token ahead of its expiry."""
+        if (expires_at := self.account.config.authentication.expires_at) is None:
+            return
+        # Tokens that could not be refreshed are retried after a while
+        refresh_at = max(
+            expires_at - TOKEN_REFRESH_AHEAD - TOKEN_REFRESH_JITTER * random.random(),
+            dt_util.utcnow() + TOKEN_REFRESH_RETRY,
+        )
+        self._unsub_token_refresh = async_track_point_in_utc_time(
+            self.hass, self._async_refresh_access_token, refresh_at
+        )
+
+    async def _async_refresh_access_token(self, _now: datetime) -> None:
+        """Refresh the access token, so polls and commands start with a valid one."""
+        self._unsub_token_refresh = None
+        authentication = self.account.config.authentication
+        old_refresh_token = self.account.refresh_token
+        try:
+            async with authentication.login_lock:
+                await authentication.login()
+        except (MyBMWAuthError, MyBMWCaptchaMissingError) as err:
+            # Let the next poll run into the error and handle reauthentication
+            _LOGGER.debug("Unable to refresh access token of %s: %s", self.name, err)
+            await self.async_request_refresh()
+            return
+        except (MyBMWAPIError, RequestError) as err:
+            _LOGGER.debug("Unable to refresh access token of %s: %s", self.name, err)
+            self._async_schedule_token_refresh()
+            return
+        finally:
+            self.quota.consume(1, dt_util.utcnow())
+
+        if self.account.refresh_token != old_refresh_token:
+            await self._async_store_refresh_token()
+        self._async_schedule_token_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and ignore new runs."""
+        if self._unsub_token_refresh:
+            self._unsub_token_refresh()
+            self._unsub_token_refresh = None
+        self._async_flush_refresh_token()
+        self._refresh_token_debouncer.async_shutdown()
+        for debouncer in self._vehicle_refresh_debouncers.values():
+            debouncer.async_shutdown()
+        await super().async_shutdown()
+        self._stagger.unregister(self.config_entry.entry_id)
+
+    async def _async_store_refresh_token(self) -> None:
+        """Write the rotated refresh token to the config entry, debounced."""
+        self._pending_refresh_token = self.account.refresh_token
+        await self._refresh_token_debouncer.async_call()
+
+    @callback
+    def _async_handle_stop(self, event: Event) -> None:
+        """Write a pending refresh token before Home Assistant stops."""
+        self._async_flush_refresh_token()
+
+    @callback
+    def _async_flush_refresh_token(self) -> None:
+        """Write a pending refresh token right away."""
+        self._refresh_token_debouncer.async_cancel()
+        self._async_save_refresh_token()
+
+    @callback
+    def _async_save_refresh_token(self) -> None:
+        """Write the latest rotated refresh token to the config entry."""
+        if refresh_token := self._pending_refresh_token:
+            self._pending_refresh_token = None
+            self._update_config_entry_refresh_token(refresh_token)
 
     def _update_config_entry_refresh_token(self, refresh_token: str | None) -> None:
         """Update or delete the refresh_token in the Config Entry."""
@@ -3,12 +3,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
 
 from bimmer_connected.vehicle import MyBMWVehicle
 
 from homeassistant.components.device_tracker import TrackerEntity
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import BMWConfigEntry
@@ -57,30 +56,18 @@ class BMWDeviceTracker(BMWBaseEntity, TrackerEntity):
         vehicle: MyBMWVehicle,
     ) -> None:
         """Initialize the Tracker."""
-        super().__init__(coordinator, vehicle)
+        # Tracking is enabled by the capabilities of the vehicle
+        super().__init__(coordinator, vehicle, ("vehicle_location", "capabilities"))
         self._attr_unique_id = vehicle.vin
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return entity specific state attributes."""
-        return {ATTR_DIRECTION: self.vehicle.vehicle_location.heading}
-
-    @property
-    def latitude(self) -> float | None:
-        """Return latitude value of the device."""
-        return (
-            self.vehicle.vehicle_location.location[0]
-            if self.vehicle.is_vehicle_tracking_enabled
-            and self.vehicle.vehicle_location.location
-            else None
-        )
-
-    @property
-    def longitude(self) -> float | None:
-        """Return longitude value of the device."""
-        return (
-            self.vehicle.vehicle_location.location[1]
-            if self.vehicle.is_vehicle_tracking_enabled
-            and self.vehicle.vehicle_location.location
-            else None
-        )
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        vehicle_location = self.vehicle.vehicle_location
+        if self.vehicle.is_vehicle_tracking_enabled and vehicle_location.location:
+            self._attr_latitude = vehicle_location.location[0]
+            self._attr_longitude = vehicle_location.location[1]
+        else:
+            self._attr_latitude = self._attr_longitude = None
+        self._attr_extra_state_attributes = {ATTR_DIRECTION: vehicle_location.heading}
+        super()._handle_coordinator_update()
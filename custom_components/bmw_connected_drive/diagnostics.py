@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import asdict
+from datetime import timedelta
 import json
 from typing import TYPE_CHECKING, Any
 
@@ -11,13 +12,17 @@ from bimmer_connected.utils import MyBMWJSONEncoder
 from homeassistant.components.diagnostics import async_redact_data
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.device_registry import DeviceEntry, DeviceEntryType
+from homeassistant.util import dt as dt_util
 
 from . import BMWConfigEntry
 from .const import CONF_REFRESH_TOKEN
 
 PARALLEL_UPDATES = 1
 
+# Diagnostics downloaded shortly after each other share the same data
+DIAGNOSTICS_MAX_AGE = timedelta(minutes=1)
+
 if TYPE_CHECKING:
     from bimmer_connected.vehicle import MyBMWVehicle
 
@@ -53,23 +58,26 @@ async def async_get_config_entry_diagnostics(
     """Return diagnostics for a config entry."""
     coordinator = config_entry.runtime_data
 
-    coordinator.account.config.log_responses = True
-    await coordinator.account.get_vehicles(force_init=True)
+    await coordinator.async_fetch_vehicles(
+        log_responses=True, max_age=DIAGNOSTICS_MAX_AGE
+    )
 
     diagnostics_data = {
         "info": async_redact_data(config_entry.data, TO_REDACT_INFO),
+        "coordinator": {
+            "breaker": coordinator.breaker.as_dict(),
+            "stale": coordinator.is_stale,
+        },
         "data": [
             async_redact_data(vehicle_to_dict(vehicle), TO_REDACT_DATA)
             for vehicle in coordinator.account.vehicles
         ],
         "fingerprint": async_redact_data(
-            [asdict(r) for r in coordinator.account.get_stored_responses()],
+            [asdict(r) for r in coordinator.get_logged_responses()],
             TO_REDACT_DATA,
         ),
     }
 
-    coordinator.account.config.log_responses = False
-
     return diagnostics_data
 
 
@@ -79,8 +87,20 @@ async def async_get_device_diagnostics(
     """Return diagnostics for a device."""
     coordinator = config_entry.runtime_data
 
-    coordinator.account.config.log_responses = True
-    await coordinator.account.get_vehicles(force_init=True)
+    # The service device of the account (request budget) is not a vehicle
+    if device.entry_type is DeviceEntryType.SERVICE:
+        return {
+            "info": async_redact_data(config_entry.data, TO_REDACT_INFO),
+            "coordinator": {
+                "breaker": coordinator.breaker.as_dict(),
+                "stale": coordinator.is_stale,
+            },
+            "request_budget": coordinator.quota.as_dict(dt_util.utcnow()),
+        }
+
+    await coordinator.async_fetch_vehicles(
+        log_responses=True, max_age=DIAGNOSTICS_MAX_AGE
+    )
 
     vin = next(iter(device.identifiers))[1]
     vehicle = coordinator.account.get_vehicle(vin)
@@ -90,11 +110,10 @@ async def async_get_device_diagnostics(
         "data": async_redact_data(vehicle_to_dict(vehicle), TO_REDACT_DATA),
         # Always have to get the full fingerprint as the VIN is redacted beforehand by the library
         "fingerprint": async_redact_data(
-            [asdict(r) for r in coordinator.account.get_stored_responses()],
+            [asdict(r) for r in coordinator.get_logged_responses()],
             TO_REDACT_DATA,
         ),
+        "remote_commands": {"queued": coordinator.command_queue_depth(vin)},
     }
 
-    coordinator.account.config.log_responses = False
-
     return diagnostics_data
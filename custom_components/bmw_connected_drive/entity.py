@@ -2,39 +2,147 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
 from bimmer_connected.vehicle import MyBMWVehicle
 
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import CALLBACK_TYPE, HassJob, State, callback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTR_STALE
 from .coordinator import BMWDataUpdateCoordinator
 
+# Optimistic values the vehicle did not report within this many seconds are
+# replaced by the vehicle state again
+OPTIMISTIC_STATE_TIMEOUT = 600
+
 
 class BMWBaseEntity(CoordinatorEntity[BMWDataUpdateCoordinator]):
     """Common base for BMW entities."""
 
     _attr_has_entity_name = True
 
+    # Value set by a remote command, shown until the vehicle reports it
+    _optimistic_value: Any = None
+    _unsub_optimistic_timeout: CALLBACK_TYPE | None = None
+    # Last state written on a coordinator update
+    _last_written_fingerprint: tuple[Any, ...] | None = None
+    _last_written_state: State | None = None
+
     def __init__(
         self,
         coordinator: BMWDataUpdateCoordinator,
         vehicle: MyBMWVehicle,
+        state_group: str | tuple[str, ...] | None = None,
     ) -> None:
-        """Initialize entity."""
-        super().__init__(coordinator)
+        """Initialize entity.
+
+        The entity is only updated if `state_group` (an attribute of the
+        vehicle, e.g. `fuel_and_battery`, or a tuple of them) changed.
+        Entities without a state group are updated on any change of the
+        vehicle.
+        """
+        if isinstance(state_group, str):
+            state_group = (state_group,)
+        super().__init__(coordinator, context=(vehicle.vin, state_group))
 
         self.vehicle = vehicle
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, vehicle.vin)},
-            manufacturer=vehicle.brand.name,
-            model=vehicle.name,
-            name=vehicle.name,
-            serial_number=vehicle.vin,
-        )
+        self._attr_device_info = coordinator.get_device_info(vehicle)
 
     async def async_added_to_hass(self) -> None:
         """When entity is added to hass."""
         await super().async_added_to_hass()
+        self.async_on_remove(self._async_clear_optimistic_state)
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless nothing changed since the last write."""
+        fingerprint = self._state_fingerprint()
+        if (
+            fingerprint == self._last_written_fingerprint
+            and self._last_written_state is not None
+            # The state may have been written elsewhere since
+            and self.hass.states.get(self.entity_id) is self._last_written_state
+        ):
+            return
+        self.async_write_ha_state()
+        self._last_written_fingerprint = fingerprint
+        self._last_written_state = self.hass.states.get(self.entity_id)
+
+    @property
+    def extra_state_attributes(self) -> Mapping[str, Any] | None:
+        """Return the entity attributes, see _mark_stale."""
+        return self._mark_stale(super().extra_state_attributes)
+
+    def _mark_stale(
+        self, attributes: Mapping[str, Any] | None
+    ) -> Mapping[str, Any] | None:
+        """Add the stale attribute while the vehicle data is restored."""
+        if not self.coordinator.is_stale:
+            return attributes
+        return {**(attributes or {}), ATTR_STALE: True}
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the values making up the state written to the state machine."""
+        return (
+            self.available,
+            self.state,
+            self.state_attributes,
+            self.extra_state_attributes,
+        )
+
+    @callback
+    def _async_set_optimistic_state(self, value: Any) -> None:
+        """Show the value set by a remote command until the vehicle reports it.
+
+        Entities pass the vehicle state through _reconcile_optimistic_state
+        when updating from the coordinator.
+        """
+        self._async_clear_optimistic_state()
+        self._optimistic_value = value
+        self._unsub_optimistic_timeout = async_call_later(
+            self.hass,
+            OPTIMISTIC_STATE_TIMEOUT,
+            HassJob(self._async_optimistic_state_expired, cancel_on_shutdown=True),
+        )
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_discard_optimistic_state(self, value: Any) -> None:
+        """Show the vehicle state again after setting `value` failed.
+
+        Values set by newer commands are kept.
+        """
+        if self._optimistic_value is not None and self._optimistic_value == value:
+            self._async_clear_optimistic_state()
+            self._handle_coordinator_update()
+
+    @callback
+    def _async_clear_optimistic_state(self) -> None:
+        """Drop the optimistic value without updating the entity."""
+        if self._unsub_optimistic_timeout is not None:
+            self._unsub_optimistic_timeout()
+            self._unsub_optimistic_timeout = None
+        self._optimistic_value = None
+
+    @callback
+    def _async_optimistic_state_expired(self, _now: datetime) -> None:
+        """Show the vehicle state again if it never reported the value."""
+        self._unsub_optimistic_timeout = None
+        self._optimistic_value = None
         self._handle_coordinator_update()
+
+    @callback
+    def _reconcile_optimistic_state[_T](self, vehicle_value: _T) -> _T:
+        """Return the value to show for the state reported by the vehicle."""
+        if self._optimistic_value is None:
+            return vehicle_value
+        if vehicle_value == self._optimistic_value:
+            self._async_clear_optimistic_state()
+            return vehicle_value
+        return self._optimistic_value  # type: ignore[no-any-return]
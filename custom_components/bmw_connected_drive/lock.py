@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import partial
 import logging
 from typing import Any
 
@@ -15,10 +16,12 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommand
+from .const import LOCKED_STATES
 from .coordinator import BMWDataUpdateCoordinator
 from .entity import BMWBaseEntity
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 DOOR_LOCK_STATE = "door_lock_state"
 
@@ -50,7 +53,7 @@ class BMWLock(BMWBaseEntity, LockEntity):
         vehicle: MyBMWVehicle,
     ) -> None:
         """Initialize the lock."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, "doors_and_windows")
 
         self._attr_unique_id = f"{vehicle.vin}-lock"
         self.door_lock_state_available = vehicle.is_lsc_enabled
@@ -62,12 +65,24 @@ class BMWLock(BMWBaseEntity, LockEntity):
         if self.door_lock_state_available:
             # Optimistic state set here because it takes some time before the
             # update callback response
-            self._attr_is_locked = True
-            self.async_write_ha_state()
+            self._async_set_optimistic_state(True)
         try:
-            await self.vehicle.remote_services.trigger_remote_door_lock()
+            await self.coordinator.async_execute_remote_command(
+                self.vehicle.vin,
+                RemoteCommand.DOOR_LOCK,
+                self.vehicle.remote_services.trigger_remote_door_lock,
+                in_target_state=lambda: (
+                    self.door_lock_state_available
+                    and self.vehicle.doors_and_windows.door_lock_state in LOCKED_STATES
+                ),
+                on_error=partial(self._async_discard_optimistic_state, True),
+            )
+        except HomeAssistantError:
+            self._async_discard_optimistic_state(True)
+            raise
         except MyBMWAPIError as ex:
             # Set the state to unknown if the command fails
+            self._async_clear_optimistic_state()
             self._attr_is_locked = None
             self.async_write_ha_state()
             raise HomeAssistantError(
@@ -86,12 +101,25 @@ class BMWLock(BMWBaseEntity, LockEntity):
         if self.door_lock_state_available:
             # Optimistic state set here because it takes some time before the
             # update callback response
-            self._attr_is_locked = False
-            self.async_write_ha_state()
+            self._async_set_optimistic_state(False)
         try:
-            await self.vehicle.remote_services.trigger_remote_door_unlock()
+            await self.coordinator.async_execute_remote_command(
+                self.vehicle.vin,
+                RemoteCommand.DOOR_LOCK,
+                self.vehicle.remote_services.trigger_remote_door_unlock,
+                in_target_state=lambda: (
+                    self.door_lock_state_available
+                    and self.vehicle.doors_and_windows.door_lock_state
+                    == LockState.UNLOCKED
+                ),
+                on_error=partial(self._async_discard_optimistic_state, False),
+            )
+        except HomeAssistantError:
+            self._async_discard_optimistic_state(False)
+            raise
         except MyBMWAPIError as ex:
             # Set the state to unknown if the command fails
+            self._async_clear_optimistic_state()
             self._attr_is_locked = None
             self.async_write_ha_state()
             raise HomeAssistantError(
@@ -110,10 +138,9 @@ class BMWLock(BMWBaseEntity, LockEntity):
 
         # Only update the HA state machine if the vehicle reliably reports its lock state
         if self.door_lock_state_available:
-            self._attr_is_locked = self.vehicle.doors_and_windows.door_lock_state in {
-                LockState.LOCKED,
-                LockState.SECURED,
-            }
+            self._attr_is_locked = self._reconcile_optimistic_state(
+                self.vehicle.doors_and_windows.door_lock_state in LOCKED_STATES
+            )
             self._attr_extra_state_attributes = {
                 DOOR_LOCK_STATE: self.vehicle.doors_and_windows.door_lock_state.value
             }
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 import logging
 from typing import Any, cast
 
@@ -21,11 +23,18 @@ from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommand
+from .coordinator import BMWDataUpdateCoordinator
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 ATTR_LOCATION_ATTRIBUTES = ["street", "city", "postal_code", "country"]
 
+# Vehicles a POI is sent to at the same time
+MAX_CONCURRENT_POI_TARGETS = 4
+# Seconds to wait for a single vehicle to accept a POI
+POI_SEND_TIMEOUT = 60
+
 POI_SCHEMA = vol.Schema(
     {
         vol.Required(ATTR_LATITUDE): cv.latitude,
@@ -51,13 +60,20 @@ def get_service(
     )
 
     targets = {}
-    if (
-        config_entry
-        and (coordinator := config_entry.runtime_data)
-        and not coordinator.read_only
-    ):
+    coordinator = config_entry.runtime_data if config_entry else None
+    if coordinator and not coordinator.read_only:
         targets.update({v.name: v for v in coordinator.account.vehicles})
-    return BMWNotificationService(targets)
+    return BMWNotificationService(targets, coordinator)
+
+
+async def _async_trigger_send_poi(vehicle: MyBMWVehicle, poi: PointOfInterest) -> None:
+    """Send a POI to a vehicle.
+
+    The timeout only starts once the command is executed, not while it waits
+    behind other commands of the vehicle.
+    """
+    async with asyncio.timeout(POI_SEND_TIMEOUT):
+        await vehicle.remote_services.trigger_send_poi(poi)
 
 
 class BMWNotificationService(BaseNotificationService):
@@ -65,15 +81,35 @@ class BMWNotificationService(BaseNotificationService):
 
     vehicle_targets: dict[str, MyBMWVehicle]
 
-    def __init__(self, targets: dict[str, MyBMWVehicle]) -> None:
+    def __init__(
+        self,
+        targets: dict[str, MyBMWVehicle],
+        coordinator: BMWDataUpdateCoordinator | None,
+    ) -> None:
         """Set up the notification service."""
         self.vehicle_targets = targets
+        self.coordinator = coordinator
 
     @property
     def targets(self) -> dict[str, Any] | None:
         """Return a dictionary of registered targets."""
         return self.vehicle_targets
 
+    def _get_vehicle(self, target: MyBMWVehicle | str) -> MyBMWVehicle:
+        """Return the vehicle of a target.
+
+        Targets are vehicle names if the generic notify action is used.
+        """
+        if isinstance(target, MyBMWVehicle):
+            return target
+        if (vehicle := self.vehicle_targets.get(target)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="notify_target_not_found",
+                translation_placeholders={"target": target},
+            )
+        return vehicle
+
     async def async_send_message(self, message: str = "", **kwargs: Any) -> None:
         """Send a message or POI to the car."""
 
@@ -99,15 +135,48 @@ class BMWNotificationService(BaseNotificationService):
                 },
             ) from ex
 
-        for vehicle in kwargs[ATTR_TARGET]:
-            vehicle = cast(MyBMWVehicle, vehicle)
-            _LOGGER.debug("Sending message to %s", vehicle.name)
-
-            try:
-                await vehicle.remote_services.trigger_send_poi(poi)
-            except MyBMWAPIError as ex:
-                raise HomeAssistantError(
-                    translation_domain=DOMAIN,
-                    translation_key="remote_service_error",
-                    translation_placeholders={"exception": str(ex)},
-                ) from ex
+        vehicles = [self._get_vehicle(target) for target in kwargs[ATTR_TARGET]]
+        coordinator = cast(BMWDataUpdateCoordinator, self.coordinator)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_POI_TARGETS)
+
+        async def _async_send_poi(vehicle: MyBMWVehicle) -> None:
+            async with semaphore:
+                _LOGGER.debug("Sending message to %s", vehicle.name)
+                await coordinator.async_execute_remote_command(
+                    vehicle.vin,
+                    RemoteCommand.SEND_POI,
+                    partial(_async_trigger_send_poi, vehicle, poi),
+                )
+
+        # A failing or slow vehicle must not delay or cancel the others
+        results = await asyncio.gather(
+            *(_async_send_poi(vehicle) for vehicle in vehicles),
+            return_exceptions=True,
+        )
+
+        errors: dict[str, BaseException] = {}
+        for vehicle, result in zip(vehicles, results, strict=True):
+            if isinstance(result, TimeoutError):
+                errors[vehicle.name] = TimeoutError(
+                    f"No response within {POI_SEND_TIMEOUT} seconds"
+                )
+            elif isinstance(result, (MyBMWAPIError, HomeAssistantError)):
+                errors[vehicle.name] = result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                _LOGGER.debug("Sent message to %s", vehicle.name)
+
+        if not errors:
+            return
+        for name, ex in errors.items():
+            _LOGGER.debug("Sending message to %s failed: %s", name, ex)
+        if len(vehicles) == 1:
+            exception = str(next(iter(errors.values())))
+        else:
+            exception = ", ".join(f"{name}: {ex}" for name, ex in errors.items())
+        raise HomeAssistantError(
+            translation_domain=DOMAIN,
+            translation_key="remote_service_error",
+            translation_placeholders={"exception": exception},
+        ) from next(iter(errors.values()))
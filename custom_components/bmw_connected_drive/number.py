@@ -1,9 +1,9 @@
 """Number platform for BMW."""
 
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import partial
 import logging
-from typing import Any
 
 from bimmer_connected.models import MyBMWAPIError
 from bimmer_connected.vehicle import MyBMWVehicle
@@ -14,7 +14,7 @@ from homeassistant.components.number import (
     NumberEntityDescription,
     NumberMode,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
@@ -22,7 +22,7 @@ from . import DOMAIN, BMWConfigEntry
 from .coordinator import BMWDataUpdateCoordinator
 from .entity import BMWBaseEntity
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,8 +32,9 @@ class BMWNumberEntityDescription(NumberEntityDescription):
     """Describes BMW number entity."""
 
     value_fn: Callable[[MyBMWVehicle], float | int | None]
-    remote_service: Callable[[MyBMWVehicle, float | int], Coroutine[Any, Any, Any]]
+    charging_setting: str
     is_available: Callable[[MyBMWVehicle], bool] = lambda _: False
+    state_group: str | None = None
     dynamic_options: Callable[[MyBMWVehicle], list[str]] | None = None
 
 
@@ -41,6 +42,7 @@ NUMBER_TYPES: list[BMWNumberEntityDescription] = [
     BMWNumberEntityDescription(
         key="target_soc",
         translation_key="target_soc",
+        state_group="fuel_and_battery",
         device_class=NumberDeviceClass.BATTERY,
         is_available=lambda v: v.is_remote_set_target_soc_enabled,
         native_max_value=100.0,
@@ -48,9 +50,7 @@ NUMBER_TYPES: list[BMWNumberEntityDescription] = [
         native_step=5.0,
         mode=NumberMode.SLIDER,
         value_fn=lambda v: v.fuel_and_battery.charging_target,
-        remote_service=lambda v, o: v.remote_services.trigger_charging_settings_update(
-            target_soc=int(o)
-        ),
+        charging_setting="target_soc",
     ),
 ]
 
@@ -89,14 +89,17 @@ class BMWNumber(BMWBaseEntity, NumberEntity):
         description: BMWNumberEntityDescription,
     ) -> None:
         """Initialize an BMW Number."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.state_group)
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the entity value to represent the entity state."""
-        return self.entity_description.value_fn(self.vehicle)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self._reconcile_optimistic_state(
+            self.entity_description.value_fn(self.vehicle)
+        )
+        super()._handle_coordinator_update()
 
     async def async_set_native_value(self, value: float) -> None:
         """Update to the vehicle."""
@@ -106,9 +109,22 @@ class BMWNumber(BMWBaseEntity, NumberEntity):
             self.vehicle.vin,
             value,
         )
+        target = int(value)
+        # Show the new value while further changes are awaited and sent
+        self._async_set_optimistic_state(target)
         try:
-            await self.entity_description.remote_service(self.vehicle, value)
+            await self.coordinator.async_update_charging_settings(
+                self.vehicle,
+                self.entity_description.charging_setting,
+                target,
+                lambda: self.entity_description.value_fn(self.vehicle) == target,
+                partial(self._async_discard_optimistic_state, target),
+            )
+        except (HomeAssistantError, ValueError):
+            self._async_discard_optimistic_state(target)
+            raise
         except MyBMWAPIError as ex:
+            self._async_discard_optimistic_state(target)
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="remote_service_error",
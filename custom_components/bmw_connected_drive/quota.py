@@ -0,0 +1,122 @@
+"""API request budget of a MyBMW account."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from bimmer_connected.const import CarBrands
+
+# The actual quotas of the API are not published. The daily budget of an account
+# is the number of requests needed to poll all its vehicles at the region's scan
+# interval times this headroom. Polls at the default interval only use half of
+# what refills, the rest is left for manual refreshes, commands and diagnostics.
+POLL_BUDGET_HEADROOM = 2
+# Share of the budget that polls leave untouched for user-initiated commands,
+# about 100 commands a day for an account with four vehicles
+COMMAND_RESERVE_RATIO = 0.1
+# Polls are stretched once less than this share of the poll budget is left,
+# i.e. about five hours of the refill
+LOW_BUDGET_RATIO = 0.25
+# The longest stretch, one poll every 40 to 80 minutes depending on the region
+MAX_POLL_STRETCH = 8
+
+# Requests made by the library for the different operations
+REQUESTS_PER_VEHICLE_STATE = 2
+REQUESTS_PER_REMOTE_SERVICE = 4
+
+
+def estimate_poll_requests(vehicles: int, *, vehicle_list: bool = False) -> int:
+    """Return the number of requests needed to poll the given number of vehicles."""
+    requests = vehicles * REQUESTS_PER_VEHICLE_STATE
+    if vehicle_list:
+        # One vehicle list per brand and one profile per vehicle
+        requests += len(CarBrands) + vehicles
+    return requests
+
+
+def daily_request_budget(vehicles: int, scan_interval: timedelta) -> int:
+    """Return the daily request budget of an account, see POLL_BUDGET_HEADROOM."""
+    polls_per_day = timedelta(days=1) / scan_interval
+    return math.ceil(
+        polls_per_day * estimate_poll_requests(max(vehicles, 1)) * POLL_BUDGET_HEADROOM
+    )
+
+
+class RequestBudget:
+    """Token bucket counting the API requests of an account.
+
+    The bucket holds one day of requests and refills continuously. Polls may
+    only use the budget above the command reserve, so remote commands stay
+    possible even if polling exhausted its share.
+    """
+
+    def __init__(self, daily_requests: int, now: datetime) -> None:
+        """Initialize a full bucket."""
+        self.capacity = 0.0
+        self._tokens = 0.0
+        self._refill_rate = 0.0
+        self._updated = now
+        self.resize(daily_requests, now)
+
+    def resize(self, daily_requests: int, now: datetime) -> None:
+        """Change the daily budget, e.g. after vehicles were added or removed.
+
+        The requests already used are kept.
+        """
+        self._refill(now)
+        capacity = float(daily_requests)
+        self._tokens = min(max(self._tokens + capacity - self.capacity, 0), capacity)
+        self.capacity = capacity
+        self.reserve = capacity * COMMAND_RESERVE_RATIO
+        self._refill_rate = capacity / timedelta(days=1).total_seconds()
+
+    def _refill(self, now: datetime) -> None:
+        """Add the requests that became available since the last update."""
+        elapsed = max((now - self._updated).total_seconds(), 0)
+        self._tokens = min(self._tokens + elapsed * self._refill_rate, self.capacity)
+        self._updated = now
+
+    def remaining(self, now: datetime) -> int:
+        """Return the number of requests left."""
+        self._refill(now)
+        return int(self._tokens)
+
+    def as_dict(self, now: datetime) -> dict[str, Any]:
+        """Return the budget state for diagnostics."""
+        self._refill(now)
+        return {
+            "capacity": int(self.capacity),
+            "reserve": int(self.reserve),
+            "remaining": int(self._tokens),
+        }
+
+    def consume(self, requests: int, now: datetime) -> None:
+        """Count requests that were sent to the API."""
+        self._refill(now)
+        self._tokens = max(self._tokens - requests, 0)
+
+    def exhaust(self, now: datetime) -> None:
+        """Drop the poll budget after the API reported an exceeded quota."""
+        self._refill(now)
+        self._tokens = min(self._tokens, self.reserve)
+
+    def can_poll(self, requests: int, now: datetime) -> bool:
+        """Return True if a poll fits into the budget above the reserve."""
+        self._refill(now)
+        return self._tokens - requests >= self.reserve
+
+    def can_command(self, requests: int, now: datetime) -> bool:
+        """Return True if a remote command fits into the budget."""
+        self._refill(now)
+        return self._tokens >= requests
+
+    def poll_interval_factor(self, now: datetime) -> float:
+        """Return how much the poll interval should be stretched."""
+        self._refill(now)
+        low_budget = (self.capacity - self.reserve) * LOW_BUDGET_RATIO
+        available = self._tokens - self.reserve
+        if available >= low_budget:
+            return 1.0
+        return min(low_budget / max(available, 1), MAX_POLL_STRETCH)
@@ -0,0 +1,286 @@
+"""Per-vehicle poll scheduling for the MyBMW coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from enum import StrEnum
+import math
+import random
+from typing import Any
+
+from bimmer_connected.vehicle import MyBMWVehicle
+from bimmer_connected.vehicle.fuel_and_battery import ChargingState
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+# Vehicles without any change for this long are polled less often
+IDLE_AFTER = timedelta(hours=3)
+IDLE_INTERVAL_FACTOR = 4
+# Lower bound for active vehicles, relative to the region scan interval
+ACTIVE_INTERVAL_MIN_FACTOR = 0.25
+# Vehicles due within this window are polled together with the due ones
+COALESCE_WINDOW = timedelta(seconds=30)
+# Consecutive failed polls before the poll interval is backed off
+BREAKER_FAILURE_THRESHOLD = 2
+# Upper bound of the backoff, relative to the region scan interval
+BREAKER_MAX_BACKOFF_FACTOR = 12
+# Accounts fetching their vehicles at the same time
+MAX_CONCURRENT_ACCOUNT_FETCHES = 2
+
+
+@dataclass
+class VehiclePollState:
+    """Scheduling state of a single vehicle."""
+
+    next_poll: datetime
+    last_change: datetime
+    signature: tuple[Any, ...] | None = None
+    active: bool = False
+
+    def is_idle(self, now: datetime) -> bool:
+        """Return True if the vehicle has not changed for a long time."""
+        return not self.active and now - self.last_change >= IDLE_AFTER
+
+
+def _activity_signature(vehicle: MyBMWVehicle) -> tuple[Any, ...]:
+    """Return the values used to detect if a vehicle is moving or changing."""
+    return (
+        vehicle.mileage,
+        vehicle.vehicle_location.location,
+        vehicle.fuel_and_battery.charging_status,
+        vehicle.doors_and_windows.door_lock_state,
+    )
+
+
+class VehiclePollScheduler:
+    """Keep a separate next poll time for each vehicle of an account.
+
+    Vehicles that are charging or moving are polled more often, vehicles that
+    have been parked without changes for hours less often. The additional polls
+    of active vehicles are paid for by the idle ones, so the account never
+    exceeds the request rate of polling every vehicle at the region interval.
+    """
+
+    def __init__(self, base_interval: timedelta) -> None:
+        """Initialize the scheduler."""
+        self.base_interval = base_interval
+        self._vehicles: dict[str, VehiclePollState] = {}
+
+    def due_vins(self, now: datetime) -> set[str]:
+        """Return the VINs that should be polled now."""
+        return {
+            vin
+            for vin, state in self._vehicles.items()
+            if state.next_poll <= now + COALESCE_WINDOW
+        }
+
+    def observe(self, vehicles: Iterable[MyBMWVehicle], now: datetime) -> None:
+        """Update the activity of freshly polled vehicles."""
+        for vehicle in vehicles:
+            signature = _activity_signature(vehicle)
+            state = self._vehicles.setdefault(
+                vehicle.vin, VehiclePollState(next_poll=now, last_change=now)
+            )
+            # A changed mileage or position means the vehicle has been moving
+            moved = state.signature is not None and (
+                signature[:2] != state.signature[:2]
+            )
+            if signature != state.signature:
+                state.last_change = now
+                state.signature = signature
+            state.active = moved or (
+                vehicle.fuel_and_battery.charging_status == ChargingState.CHARGING
+            )
+
+    def reschedule(
+        self, vins: Iterable[str], now: datetime, stretch: float = 1.0
+    ) -> None:
+        """Set the next poll time of the given vehicles."""
+        intervals = self.intervals(now)
+        for vin in vins:
+            if (state := self._vehicles.get(vin)) is not None:
+                state.next_poll = now + intervals[vin] * stretch
+
+    def delay(self, delay: timedelta) -> None:
+        """Move the next poll of all vehicles back."""
+        for state in self._vehicles.values():
+            state.next_poll += delay
+
+    def remove_missing(self, vins: Iterable[str]) -> None:
+        """Forget vehicles which are no longer part of the account."""
+        for vin in self._vehicles.keys() - set(vins):
+            del self._vehicles[vin]
+
+    def intervals(self, now: datetime) -> dict[str, timedelta]:
+        """Return the current poll interval of each vehicle."""
+        idle_interval = self.base_interval * IDLE_INTERVAL_FACTOR
+        n_active = sum(state.active for state in self._vehicles.values())
+        n_idle = sum(state.is_idle(now) for state in self._vehicles.values())
+
+        active_interval = self.base_interval
+        if n_active and n_idle:
+            # Spend the requests saved on idle vehicles on the active ones
+            saved = n_idle * (1 - 1 / IDLE_INTERVAL_FACTOR)
+            # Round up to whole seconds, so the account stays within its budget
+            budget_interval = timedelta(
+                seconds=math.ceil(
+                    self.base_interval.total_seconds() * n_active / (n_active + saved)
+                )
+            )
+            active_interval = max(
+                budget_interval, self.base_interval * ACTIVE_INTERVAL_MIN_FACTOR
+            )
+
+        result: dict[str, timedelta] = {}
+        for vin, state in self._vehicles.items():
+            if state.active:
+                result[vin] = active_interval
+            elif state.is_idle(now):
+                result[vin] = idle_interval
+            else:
+                result[vin] = self.base_interval
+        return result
+
+    def next_poll(self) -> datetime | None:
+        """Return the time the next vehicle is due."""
+        if not self._vehicles:
+            return None
+        return min(state.next_poll for state in self._vehicles.values())
+
+    def next_update_interval(self, now: datetime) -> timedelta:
+        """Return the time until the next vehicle is due."""
+        if (next_poll := self.next_poll()) is None:
+            return self.base_interval
+        return max(next_poll - now, COALESCE_WINDOW)
+
+
+class BreakerState(StrEnum):
+    """State of the poll circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class PollCircuitBreaker:
+    """Back off polling of an account while the API keeps failing.
+
+    The first failure is retried at the regular interval. After that the
+    breaker opens and waits exponentially longer (with jitter) before a single
+    probe poll. A successful poll closes the breaker right away. Other
+    requests of the account wait for that, see `is_closed`.
+    """
+
+    def __init__(self, base_interval: timedelta) -> None:
+        """Initialize a closed breaker."""
+        self.base_interval = base_interval
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at: datetime | None = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Return True if the last poll succeeded (or failed only once)."""
+        return self.state is BreakerState.CLOSED
+
+    def before_poll(self, now: datetime) -> None:
+        """Let the next poll through as probe once the backoff expired.
+
+        Polls scheduled for the end of the backoff may fire slightly early, so
+        the same window is allowed as for coalescing vehicle polls.
+        """
+        if (
+            self.state is BreakerState.OPEN
+            and self.retry_at
+            and self.retry_at - COALESCE_WINDOW <= now
+        ):
+            self.state = BreakerState.HALF_OPEN
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful poll."""
+        self.state = BreakerState.CLOSED
+        self.failures = 0
+        self.retry_at = None
+
+    def record_failure(self, now: datetime) -> None:
+        """Count a failed poll and open the breaker if it keeps failing."""
+        self.failures += 1
+        if (
+            self.state is BreakerState.CLOSED
+            and self.failures < BREAKER_FAILURE_THRESHOLD
+        ):
+            return
+        backoff = min(
+            self.base_interval * 2 ** (self.failures - 1),
+            self.base_interval * BREAKER_MAX_BACKOFF_FACTOR,
+        )
+        # Spread the retries of many installations hit by the same outage
+        delay = max(backoff * random.uniform(0.5, 1), self.base_interval)
+        self.state = BreakerState.OPEN
+        self.retry_at = now + delay
+
+    def retry_delay(self, now: datetime) -> timedelta | None:
+        """Return the time until the next poll is allowed, if backing off."""
+        if self.state is not BreakerState.OPEN or self.retry_at is None:
+            return None
+        return max(self.retry_at - now, timedelta(0))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state.value,
+            "failures": self.failures,
+            "next_retry": self.retry_at.isoformat() if self.retry_at else None,
+        }
+
+
+class AccountPollStagger:
+    """Spread the polls of all MyBMW accounts across the scan interval.
+
+    Each account gets an evenly spaced phase relative to the first registered
+    account, and only a limited number of accounts fetch at the same time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stagger shared by all config entries."""
+        self.fetch_semaphore = asyncio.Semaphore(MAX_CONCURRENT_ACCOUNT_FETCHES)
+        self._schedulers: dict[str, VehiclePollScheduler] = {}
+
+    def register(self, entry_id: str, scheduler: VehiclePollScheduler) -> None:
+        """Add the poll scheduler of an account."""
+        self._schedulers[entry_id] = scheduler
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove the poll scheduler of an account."""
+        self._schedulers.pop(entry_id, None)
+
+    def phase_delay(self, entry_id: str) -> timedelta:
+        """Return how long the next poll of an account should be delayed."""
+        entry_ids = list(self._schedulers)
+        index = entry_ids.index(entry_id)
+        scheduler = self._schedulers[entry_id]
+        if (
+            index == 0
+            or (anchor := self._schedulers[entry_ids[0]].next_poll()) is None
+            or (next_poll := scheduler.next_poll()) is None
+        ):
+            return timedelta(0)
+        interval = scheduler.base_interval
+        target = anchor + interval * index / len(entry_ids)
+        return (target - next_poll) % interval
+
+
+DATA_POLL_STAGGER: HassKey[AccountPollStagger] = HassKey(f"{DOMAIN}_poll_stagger")
+
+
+def get_poll_stagger(hass: HomeAssistant) -> AccountPollStagger:
+    """Return the poll stagger shared by all config entries."""
+    if (stagger := hass.data.get(DATA_POLL_STAGGER)) is None:
+        stagger = hass.data[DATA_POLL_STAGGER] = AccountPollStagger()
+    return stagger
@@ -2,6 +2,7 @@
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any
 
@@ -16,10 +17,11 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommand
 from .coordinator import BMWDataUpdateCoordinator
 from .entity import BMWBaseEntity
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,29 +31,36 @@ class BMWSelectEntityDescription(SelectEntityDescription):
     """Describes BMW sensor entity."""
 
     current_option: Callable[[MyBMWVehicle], str]
-    remote_service: Callable[[MyBMWVehicle, str], Coroutine[Any, Any, Any]]
+    remote_command: RemoteCommand
+    remote_service: Callable[[MyBMWVehicle, str], Coroutine[Any, Any, Any]] | None = (
+        None
+    )
+    charging_setting: str | None = None
     is_available: Callable[[MyBMWVehicle], bool] = lambda _: False
+    state_group: str | None = None
     dynamic_options: Callable[[MyBMWVehicle], list[str]] | None = None
 
 
 SELECT_TYPES: tuple[BMWSelectEntityDescription, ...] = (
     BMWSelectEntityDescription(
         key="ac_limit",
+        remote_command=RemoteCommand.CHARGING_SETTINGS,
         translation_key="ac_limit",
+        state_group="charging_profile",
         is_available=lambda v: v.is_remote_set_ac_limit_enabled,
         dynamic_options=lambda v: [
             str(lim)
             for lim in v.charging_profile.ac_available_limits  # type: ignore[union-attr]
         ],
         current_option=lambda v: str(v.charging_profile.ac_current_limit),  # type: ignore[union-attr]
-        remote_service=lambda v, o: v.remote_services.trigger_charging_settings_update(
-            ac_limit=int(o)
-        ),
+        charging_setting="ac_limit",
         unit_of_measurement=UnitOfElectricCurrent.AMPERE,
     ),
     BMWSelectEntityDescription(
         key="charging_mode",
+        remote_command=RemoteCommand.CHARGING_MODE,
         translation_key="charging_mode",
+        state_group="charging_profile",
         is_available=lambda v: v.is_charging_plan_supported,
         options=[c.value.lower() for c in ChargingMode if c != ChargingMode.UNKNOWN],
         current_option=lambda v: v.charging_profile.charging_mode.value.lower(),  # type: ignore[union-attr]
@@ -96,7 +105,7 @@ class BMWSelect(BMWBaseEntity, SelectEntity):
         description: BMWSelectEntityDescription,
     ) -> None:
         """Initialize an BMW select."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.state_group)
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
         if description.dynamic_options:
@@ -109,7 +118,9 @@ class BMWSelect(BMWBaseEntity, SelectEntity):
         _LOGGER.debug(
             "Updating select '%s' of %s", self.entity_description.key, self.vehicle.name
         )
-        self._attr_current_option = self.entity_description.current_option(self.vehicle)
+        self._attr_current_option = self._reconcile_optimistic_state(
+            self.entity_description.current_option(self.vehicle)
+        )
         super()._handle_coordinator_update()
 
     async def async_select_option(self, option: str) -> None:
@@ -120,13 +131,40 @@ class BMWSelect(BMWBaseEntity, SelectEntity):
             self.vehicle.vin,
             option,
         )
+        description = self.entity_description
+        if description.charging_setting is not None:
+            # Show the new option while further changes are awaited and sent
+            self._async_set_optimistic_state(option)
         try:
-            await self.entity_description.remote_service(self.vehicle, option)
+            if description.charging_setting is not None:
+                await self.coordinator.async_update_charging_settings(
+                    self.vehicle,
+                    description.charging_setting,
+                    int(option),
+                    lambda: description.current_option(self.vehicle) == option,
+                    partial(self._async_discard_optimistic_state, option),
+                )
+            elif description.remote_service is not None:
+                await self.coordinator.async_execute_remote_command(
+                    self.vehicle.vin,
+                    description.remote_command,
+                    partial(description.remote_service, self.vehicle, option),
+                    in_target_state=lambda: (
+                        description.current_option(self.vehicle) == option
+                    ),
+                    on_error=partial(self._async_discard_optimistic_state, option),
+                )
+        except (HomeAssistantError, ValueError):
+            self._async_discard_optimistic_state(option)
+            raise
         except MyBMWAPIError as ex:
+            self._async_discard_optimistic_state(option)
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="remote_service_error",
                 translation_placeholders={"exception": str(ex)},
             ) from ex
 
+        if description.charging_setting is None:
+            self._async_set_optimistic_state(option)
         self.coordinator.async_update_listeners()
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import datetime
 import logging
+from operator import attrgetter
+from typing import Any
 
 from bimmer_connected.models import StrEnum, ValueWithUnit
 from bimmer_connected.vehicle import MyBMWVehicle
@@ -20,6 +22,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     STATE_UNKNOWN,
     UnitOfElectricCurrent,
     UnitOfLength,
@@ -27,10 +30,16 @@ from homeassistant.const import (
     UnitOfVolume,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.typing import StateType
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import dt as dt_util
 
-from . import BMWConfigEntry
+from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommandStatus
+from .const import ATTR_STALE, SIGNAL_REMOTE_COMMAND
 from .coordinator import BMWDataUpdateCoordinator
 from .entity import BMWBaseEntity
 
@@ -38,13 +47,80 @@ PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
+type _SensorValue = StateType | datetime.datetime
+
+
+def _datetime_value(state: datetime.datetime) -> datetime.datetime:
+    """Return the sensor value of a datetime."""
+    # For datetime without tzinfo, we assume it to be the same timezone as the HA instance
+    if state.tzinfo is None:
+        return state.replace(tzinfo=dt_util.get_default_time_zone())
+    return state
+
+
+def _value_with_unit_value(state: ValueWithUnit) -> StateType:
+    """Return the sensor value of a value with unit."""
+    return state.value  # type: ignore[no-any-return]
+
+
+def _str_enum_value(state: StrEnum) -> str | None:
+    """Return the lowercase sensor value of a StrEnum."""
+    value = state.value.lower()
+    return None if value == STATE_UNKNOWN else value
+
+
+def _plain_value(state: Any) -> _SensorValue:
+    """Return a vehicle attribute unchanged."""
+    return state  # type: ignore[no-any-return]
+
+
+def _get_converter(value_type: type) -> Callable[[Any], _SensorValue]:
+    """Return the conversion of vehicle attributes of a type to sensor values."""
+    if issubclass(value_type, datetime.datetime):
+        return _datetime_value
+    if issubclass(value_type, ValueWithUnit):
+        return _value_with_unit_value
+    if issubclass(value_type, StrEnum):
+        return _str_enum_value
+    return _plain_value
+
+
+def _compile_value_fn(key: str) -> Callable[[MyBMWVehicle], _SensorValue]:
+    """Return a function reading the value at the key path of a vehicle.
+
+    The values at a key path only have a type or two (e.g. None if missing),
+    so the conversion is looked up once per type instead of checking the
+    type of every value.
+    """
+    getter = attrgetter(key)
+    converters: dict[type, Callable[[Any], _SensorValue]] = {}
+
+    def value_fn(vehicle: MyBMWVehicle) -> _SensorValue:
+        state = getter(vehicle)
+        if (converter := converters.get(value_type := type(state))) is None:
+            converter = converters[value_type] = _get_converter(value_type)
+        return converter(state)
+
+    return value_fn
+
 
 @dataclass(frozen=True)
 class BMWSensorEntityDescription(SensorEntityDescription):
-    """Describes BMW sensor entity."""
+    """Describes BMW sensor entity.
+
+    The key is the attribute path of the value on the vehicle. It is compiled
+    into `value_fn` once, which is shared by the sensors of all vehicles.
+    """
 
     key_class: str | None = None
     is_available: Callable[[MyBMWVehicle], bool] = lambda v: v.is_lsc_enabled
+    value_fn: Callable[[MyBMWVehicle], _SensorValue] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        """Compile the value accessor of the key path."""
+        object.__setattr__(self, "value_fn", _compile_value_fn(self.key))
 
 
 TIRES = ["front_left", "front_right", "rear_left", "rear_right"]
@@ -195,12 +271,18 @@ async def async_setup_entry(
     """Set up the MyBMW sensors from config entry."""
     coordinator = config_entry.runtime_data
 
-    entities = [
+    entities: list[SensorEntity] = [
         BMWSensor(coordinator, vehicle, description)
         for vehicle in coordinator.account.vehicles
         for description in SENSOR_TYPES
         if description.is_available(vehicle)
     ]
+    if not coordinator.read_only:
+        entities.extend(
+            BMWRemoteCommandSensor(coordinator, vehicle)
+            for vehicle in coordinator.account.vehicles
+        )
+    entities.append(BMWRequestBudgetSensor(coordinator))
 
     async_add_entities(entities)
 
@@ -217,7 +299,7 @@ class BMWSensor(BMWBaseEntity, SensorEntity):
         description: BMWSensorEntityDescription,
     ) -> None:
         """Initialize BMW vehicle sensor."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.key.split(".")[0])
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
 
@@ -227,24 +309,84 @@ class BMWSensor(BMWBaseEntity, SensorEntity):
         _LOGGER.debug(
             "Updating sensor '%s' of %s", self.entity_description.key, self.vehicle.name
         )
+        self._attr_native_value = self.entity_description.value_fn(self.vehicle)
+        super()._handle_coordinator_update()
+
+
+class BMWRequestBudgetSensor(CoordinatorEntity[BMWDataUpdateCoordinator], SensorEntity):
+    """Representation of the remaining API requests of a MyBMW account."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_translation_key = "remaining_api_requests"
+
+    def __init__(self, coordinator: BMWDataUpdateCoordinator) -> None:
+        """Initialize the account sensor."""
+        super().__init__(coordinator)
+        config_entry = coordinator.config_entry
+        self._attr_unique_id = f"{config_entry.unique_id}-remaining_api_requests"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.unique_id)},
+            entry_type=DeviceEntryType.SERVICE,
+            manufacturer="BMW",
+            name=config_entry.title,
+        )
 
-        key_path = self.entity_description.key.split(".")
-        state = getattr(self.vehicle, key_path.pop(0))
-
-        for key in key_path:
-            state = getattr(state, key)
-
-        # For datetime without tzinfo, we assume it to be the same timezone as the HA instance
-        if isinstance(state, datetime.datetime) and state.tzinfo is None:
-            state = state.replace(tzinfo=dt_util.get_default_time_zone())
-        # For enum types, we only want the value
-        elif isinstance(state, ValueWithUnit):
-            state = state.value
-        # Get lowercase values from StrEnum
-        elif isinstance(state, StrEnum):
-            state = state.value.lower()
-            if state == STATE_UNKNOWN:
-                state = None
-
-        self._attr_native_value = state
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_native_value = self.coordinator.quota.remaining(dt_util.utcnow())
+        self._attr_extra_state_attributes = {ATTR_STALE: self.coordinator.is_stale}
         super()._handle_coordinator_update()
+
+
+class BMWRemoteCommandSensor(BMWBaseEntity, SensorEntity):
+    """Representation of the last remote command of a BMW vehicle."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_translation_key = "last_remote_command"
+
+    def __init__(
+        self,
+        coordinator: BMWDataUpdateCoordinator,
+        vehicle: MyBMWVehicle,
+    ) -> None:
+        """Initialize the remote command sensor."""
+        super().__init__(coordinator, vehicle)
+        self._attr_unique_id = f"{vehicle.vin}-last_remote_command"
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to hass."""
+        self._async_update_status(self.coordinator.command_status.get(self.vehicle.vin))
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_REMOTE_COMMAND.format(vin=self.vehicle.vin),
+                self._async_handle_status,
+            )
+        )
+
+    @callback
+    def _async_update_status(self, status: RemoteCommandStatus | None) -> None:
+        """Set the state from the status of the last remote command."""
+        if status is None:
+            return
+        self._attr_native_value = status.state.value
+        self._attr_extra_state_attributes = {
+            "command": status.command.value,
+            "error": status.error,
+            "queued": self.coordinator.command_queue_depth(self.vehicle.vin),
+        }
+
+    @callback
+    def _async_handle_status(self, status: RemoteCommandStatus) -> None:
+        """Handle a changed remote command status."""
+        self._async_update_status(status)
+        self.async_write_ha_state()
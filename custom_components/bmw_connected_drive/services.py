@@ -0,0 +1,273 @@
+"""Actions of the MyBMW integration."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from functools import partial
+import logging
+from typing import Any
+
+from bimmer_connected.models import MyBMWAPIError
+from bimmer_connected.vehicle import MyBMWVehicle
+from bimmer_connected.vehicle.fuel_and_battery import ChargingState
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_CONFIG_ENTRY_ID, ATTR_DEVICE_ID
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+
+from .commands import RemoteCommand, RemoteCommandState
+from .const import ATTR_VIN, DOMAIN, LOCKED_STATES
+from .coordinator import BMWConfigEntry, BMWDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_ACTION = "action"
+ATTR_FORCE = "force"
+
+SERVICE_UPDATE_STATE = "update_state"
+SERVICE_BATCH_LOCK = "batch_lock"
+SERVICE_BATCH_CLIMATE = "batch_climate"
+SERVICE_BATCH_CHARGE_STOP = "batch_charge_stop"
+
+# Vehicles a batch action sends commands to at the same time
+MAX_CONCURRENT_BATCH_COMMANDS = 4
+
+SERVICE_SCHEMA = vol.Schema(
+    vol.Any(
+        {vol.Required(ATTR_VIN): cv.string},
+        {vol.Required(ATTR_DEVICE_ID): cv.string},
+    )
+)
+
+_BATCH_FIELDS = {
+    vol.Optional(ATTR_VIN): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_DEVICE_ID): vol.All(cv.ensure_list, [cv.string]),
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_FORCE, default=False): cv.boolean,
+}
+BATCH_SCHEMA = vol.All(
+    vol.Schema(_BATCH_FIELDS),
+    cv.has_at_least_one_key(ATTR_VIN, ATTR_DEVICE_ID, ATTR_CONFIG_ENTRY_ID),
+)
+BATCH_CLIMATE_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_BATCH_FIELDS,
+            vol.Optional(ATTR_ACTION, default="start"): vol.In(["start", "stop"]),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_VIN, ATTR_DEVICE_ID, ATTR_CONFIG_ENTRY_ID),
+)
+
+type _RemoteFunction = Callable[[MyBMWVehicle], Coroutine[Any, Any, Any]]
+type _StateFunction = Callable[[MyBMWVehicle], bool]
+
+CLIMATE_FUNCTIONS: dict[str, tuple[_RemoteFunction, _StateFunction]] = {
+    "start": (
+        lambda v: v.remote_services.trigger_remote_air_conditioning(),
+        lambda v: v.climate.is_climate_on,
+    ),
+    "stop": (
+        lambda v: v.remote_services.trigger_remote_air_conditioning_stop(),
+        lambda v: not v.climate.is_climate_on,
+    ),
+}
+
+
+@callback
+def _async_get_coordinators(
+    hass: HomeAssistant,
+) -> dict[str, BMWDataUpdateCoordinator]:
+    """Return the coordinators of all loaded accounts by config entry ID."""
+    entries: list[BMWConfigEntry] = hass.config_entries.async_entries(DOMAIN)
+    return {
+        entry.entry_id: entry.runtime_data
+        for entry in entries
+        if entry.state is ConfigEntryState.LOADED
+    }
+
+
+@callback
+def async_get_target_vehicles(
+    hass: HomeAssistant, call: ServiceCall
+) -> list[tuple[BMWDataUpdateCoordinator, MyBMWVehicle]]:
+    """Return the vehicles selected by VIN, device or account."""
+    coordinators = _async_get_coordinators(hass)
+    vins: list[str] = cv.ensure_list(call.data.get(ATTR_VIN))
+
+    device_registry = dr.async_get(hass)
+    for device_id in cv.ensure_list(call.data.get(ATTR_DEVICE_ID)):
+        if (device := device_registry.async_get(device_id)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="device_not_found",
+                translation_placeholders={"device_id": device_id},
+            )
+        # The service device of an account (request budget) is not a vehicle
+        if device.entry_type is dr.DeviceEntryType.SERVICE:
+            continue
+        vins.extend(
+            identifier for domain, identifier in device.identifiers if domain == DOMAIN
+        )
+
+    if (entry_id := call.data.get(ATTR_CONFIG_ENTRY_ID)) is not None:
+        if (coordinator := coordinators.get(entry_id)) is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="account_not_found",
+                translation_placeholders={"config_entry_id": entry_id},
+            )
+        vins.extend(vehicle.vin for vehicle in coordinator.account.vehicles)
+
+    vehicles: dict[str, tuple[BMWDataUpdateCoordinator, MyBMWVehicle]] = {}
+    for vin in vins:
+        for coordinator in coordinators.values():
+            if (vehicle := coordinator.account.get_vehicle(vin)) is not None:
+                break
+        else:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="vehicle_not_found",
+                translation_placeholders={"vin": vin},
+            )
+        vehicles[vehicle.vin] = (coordinator, vehicle)
+    return list(vehicles.values())
+
+
+async def _async_batch_command(
+    call: ServiceCall,
+    command: RemoteCommand,
+    remote_function: _RemoteFunction,
+    in_target_state: _StateFunction,
+) -> ServiceResponse:
+    """Send a remote command to all selected vehicles.
+
+    A failing vehicle does not stop the command for the others, the result of
+    each vehicle is returned instead. Vehicles already in the target state are
+    skipped if enabled in the options, unless `force` is set.
+    """
+    targets = async_get_target_vehicles(call.hass, call)
+    for coordinator, vehicle in targets:
+        if coordinator.read_only:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="read_only",
+                translation_placeholders={"vin": vehicle.vin},
+            )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCH_COMMANDS)
+
+    async def _async_execute(
+        coordinator: BMWDataUpdateCoordinator, vehicle: MyBMWVehicle
+    ) -> dict[str, Any]:
+        if not call.data[ATTR_FORCE] and coordinator.async_skip_redundant_command(
+            vehicle.vin, command, partial(in_target_state, vehicle)
+        ):
+            return {"state": RemoteCommandState.SKIPPED.value, "error": None}
+        async with semaphore:
+            _LOGGER.debug("Sending '%s' command to %s", command, vehicle.name)
+            try:
+                await coordinator.async_execute_remote_command(
+                    vehicle.vin, command, lambda: remote_function(vehicle)
+                )
+            except (MyBMWAPIError, HomeAssistantError, ValueError) as ex:
+                return {
+                    "state": RemoteCommandState.FAILED.value,
+                    "error": str(ex),
+                }
+        state = (
+            RemoteCommandState.PENDING
+            if coordinator.background_commands
+            else RemoteCommandState.EXECUTED
+        )
+        return {"state": state.value, "error": None}
+
+    results = await asyncio.gather(
+        *(_async_execute(coordinator, vehicle) for coordinator, vehicle in targets)
+    )
+    for coordinator in {coordinator for coordinator, _ in targets}:
+        coordinator.async_update_listeners()
+
+    return {
+        "vehicles": [
+            {"vin": vehicle.vin, "name": vehicle.name, **result}
+            for (_, vehicle), result in zip(targets, results, strict=True)
+        ]
+    }
+
+
+async def _async_update_state(call: ServiceCall) -> None:
+    """Refresh the state of the selected vehicles."""
+    await asyncio.gather(
+        *(
+            coordinator.async_request_vehicle_refresh(vehicle.vin)
+            for coordinator, vehicle in async_get_target_vehicles(call.hass, call)
+        )
+    )
+
+
+async def _async_batch_lock(call: ServiceCall) -> ServiceResponse:
+    """Lock all selected vehicles."""
+    return await _async_batch_command(
+        call,
+        RemoteCommand.DOOR_LOCK,
+        lambda v: v.remote_services.trigger_remote_door_lock(),
+        lambda v: (
+            v.is_lsc_enabled and v.doors_and_windows.door_lock_state in LOCKED_STATES
+        ),
+    )
+
+
+async def _async_batch_climate(call: ServiceCall) -> ServiceResponse:
+    """Start or stop the climatization of all selected vehicles."""
+    return await _async_batch_command(
+        call, RemoteCommand.CLIMATE, *CLIMATE_FUNCTIONS[call.data[ATTR_ACTION]]
+    )
+
+
+async def _async_batch_charge_stop(call: ServiceCall) -> ServiceResponse:
+    """Stop charging of all selected vehicles."""
+    return await _async_batch_command(
+        call,
+        RemoteCommand.CHARGING,
+        lambda v: v.remote_services.trigger_charge_stop(),
+        lambda v: v.fuel_and_battery.charging_status != ChargingState.CHARGING,
+    )
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the actions of the integration."""
+    hass.services.async_register(
+        DOMAIN, SERVICE_UPDATE_STATE, _async_update_state, schema=SERVICE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH_LOCK,
+        _async_batch_lock,
+        schema=BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH_CLIMATE,
+        _async_batch_climate,
+        schema=BATCH_CLIMATE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BATCH_CHARGE_STOP,
+        _async_batch_charge_stop,
+        schema=BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
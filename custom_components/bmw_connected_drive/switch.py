@@ -2,6 +2,7 @@
 
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
+from functools import partial
 import logging
 from typing import Any
 
@@ -10,15 +11,16 @@ from bimmer_connected.vehicle import MyBMWVehicle
 from bimmer_connected.vehicle.fuel_and_battery import ChargingState
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from . import DOMAIN, BMWConfigEntry
+from .commands import RemoteCommand
 from .coordinator import BMWDataUpdateCoordinator
 from .entity import BMWBaseEntity
 
-PARALLEL_UPDATES = 1
+PARALLEL_UPDATES = 0
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,7 +32,9 @@ class BMWSwitchEntityDescription(SwitchEntityDescription):
     value_fn: Callable[[MyBMWVehicle], bool]
     remote_service_on: Callable[[MyBMWVehicle], Coroutine[Any, Any, Any]]
     remote_service_off: Callable[[MyBMWVehicle], Coroutine[Any, Any, Any]]
+    remote_command: RemoteCommand
     is_available: Callable[[MyBMWVehicle], bool] = lambda _: False
+    state_group: str | None = None
     dynamic_options: Callable[[MyBMWVehicle], list[str]] | None = None
 
 
@@ -47,6 +51,8 @@ NUMBER_TYPES: list[BMWSwitchEntityDescription] = [
     BMWSwitchEntityDescription(
         key="climate",
         translation_key="climate",
+        state_group="climate",
+        remote_command=RemoteCommand.CLIMATE,
         is_available=lambda v: v.is_remote_climate_stop_enabled,
         value_fn=lambda v: v.climate.is_climate_on,
         remote_service_on=lambda v: v.remote_services.trigger_remote_air_conditioning(),
@@ -55,6 +61,8 @@ NUMBER_TYPES: list[BMWSwitchEntityDescription] = [
     BMWSwitchEntityDescription(
         key="charging",
         translation_key="charging",
+        state_group="fuel_and_battery",
+        remote_command=RemoteCommand.CHARGING,
         is_available=lambda v: v.is_remote_charge_stop_enabled,
         value_fn=lambda v: v.fuel_and_battery.charging_status in CHARGING_STATE_ON,
         remote_service_on=lambda v: v.remote_services.trigger_charge_start(),
@@ -97,35 +105,54 @@ class BMWSwitch(BMWBaseEntity, SwitchEntity):
         description: BMWSwitchEntityDescription,
     ) -> None:
         """Initialize an BMW Switch."""
-        super().__init__(coordinator, vehicle)
+        super().__init__(coordinator, vehicle, description.state_group)
         self.entity_description = description
         self._attr_unique_id = f"{vehicle.vin}-{description.key}"
 
-    @property
-    def is_on(self) -> bool:
-        """Return the entity value to represent the entity state."""
-        return self.entity_description.value_fn(self.vehicle)
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._attr_is_on = self._reconcile_optimistic_state(
+            self.entity_description.value_fn(self.vehicle)
+        )
+        super()._handle_coordinator_update()
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn the switch on."""
         try:
-            await self.entity_description.remote_service_on(self.vehicle)
+            await self.coordinator.async_execute_remote_command(
+                self.vehicle.vin,
+                self.entity_description.remote_command,
+                partial(self.entity_description.remote_service_on, self.vehicle),
+                in_target_state=lambda: self.entity_description.value_fn(self.vehicle),
+                on_error=partial(self._async_discard_optimistic_state, True),
+            )
         except MyBMWAPIError as ex:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="remote_service_error",
                 translation_placeholders={"exception": str(ex)},
             ) from ex
+        self._async_set_optimistic_state(True)
         self.coordinator.async_update_listeners()
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn the switch off."""
         try:
-            await self.entity_description.remote_service_off(self.vehicle)
+            await self.coordinator.async_execute_remote_command(
+                self.vehicle.vin,
+                self.entity_description.remote_command,
+                partial(self.entity_description.remote_service_off, self.vehicle),
+                in_target_state=lambda: not self.entity_description.value_fn(
+                    self.vehicle
+                ),
+                on_error=partial(self._async_discard_optimistic_state, False),
+            )
         except MyBMWAPIError as ex:
             raise HomeAssistantError(
                 translation_domain=DOMAIN,
                 translation_key="remote_service_error",
                 translation_placeholders={"exception": str(ex)},
             ) from ex
+        self._async_set_optimistic_state(False)
         self.coordinator.async_update_listeners()
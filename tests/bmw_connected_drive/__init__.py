@@ -9,10 +9,13 @@ import respx
 
 from homeassistant import config_entries
 from homeassistant.components.bmw_connected_drive.const import (
+    CONF_BACKGROUND_COMMANDS,
     CONF_CAPTCHA_TOKEN,
+    CONF_COMMAND_REFRESH_DELAY,
     CONF_GCID,
     CONF_READ_ONLY,
     CONF_REFRESH_TOKEN,
+    CONF_SKIP_REDUNDANT_COMMANDS,
     DOMAIN,
 )
 from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
@@ -43,7 +46,12 @@ FIXTURE_CONFIG_ENTRY = {
         CONF_REFRESH_TOKEN: FIXTURE_REFRESH_TOKEN,
         CONF_GCID: FIXTURE_GCID,
     },
-    "options": {CONF_READ_ONLY: False},
+    "options": {
+        CONF_READ_ONLY: False,
+        CONF_BACKGROUND_COMMANDS: False,
+        CONF_COMMAND_REFRESH_DELAY: 0,
+        CONF_SKIP_REDUNDANT_COMMANDS: False,
+    },
     "source": config_entries.SOURCE_USER,
     "unique_id": f"{FIXTURE_USER_INPUT[CONF_REGION]}-{FIXTURE_USER_INPUT[CONF_USERNAME]}",
 }
@@ -32,6 +32,11 @@ def bmw_fixture(monkeypatch: pytest.MonkeyPatch) -> Generator[respx.MockRouter]:
         "_POLLING_CYCLE",
         0,
     )
+    # nor for further changes of the charging settings
+    monkeypatch.setattr(
+        "homeassistant.components.bmw_connected_drive.coordinator.CHARGING_SETTINGS_DEBOUNCE",
+        0,
+    )
 
     with router:
         yield router
@@ -1,14 +1,25 @@
 """Test BMW binary sensors."""
 
+from dataclasses import replace
 from unittest.mock import patch
 
+from bimmer_connected.models import ValueWithUnit
 from freezegun import freeze_time
 import pytest
 from syrupy.assertion import SnapshotAssertion
 
+from homeassistant.components.bmw_connected_drive.binary_sensor import (
+    _check_control_messages,
+    _condition_based_services,
+    _format_cbs_reports,
+)
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util.unit_system import (
+    METRIC_SYSTEM as METRIC,
+    US_CUSTOMARY_SYSTEM as IMPERIAL,
+)
 
 from . import setup_mocked_integration
 
@@ -33,3 +44,33 @@ async def test_entity_state_attrs(
         mock_config_entry = await setup_mocked_integration(hass)
 
     await snapshot_platform(hass, entity_registry, snapshot, mock_config_entry.entry_id)
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_report_attributes_cached(
+    hass: HomeAssistant,
+) -> None:
+    """Test attributes of unchanged reports are only built once."""
+
+    # Setup component
+    mock_config_entry = await setup_mocked_integration(hass)
+    vehicle = mock_config_entry.runtime_data.account.get_vehicle("WBY00000000REXI01")
+    cbs_attributes = _condition_based_services(vehicle, METRIC)
+    hits = _format_cbs_reports.cache_info().hits
+
+    # Test
+    assert _condition_based_services(vehicle, METRIC) == cbs_attributes
+    assert _format_cbs_reports.cache_info().hits == hits + 1
+    # Unchanged reports return the same attributes
+    assert _condition_based_services(vehicle, METRIC) is cbs_attributes
+    assert _check_control_messages(vehicle) is _check_control_messages(vehicle)
+
+    # Changed reports or unit system format the attributes again
+    report = vehicle.condition_based_services.messages[0]
+    vehicle.condition_based_services.messages[0] = replace(
+        report, due_distance=ValueWithUnit(1000, "km")
+    )
+    changed_attributes = _condition_based_services(vehicle, METRIC)
+    distance_attribute = f"{report.service_type.lower()}_distance"
+    assert changed_attributes[distance_attribute] == "1000 km"
+    assert _condition_based_services(vehicle, IMPERIAL)[distance_attribute] == "621 mi"
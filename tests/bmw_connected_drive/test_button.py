@@ -1,5 +1,8 @@
 """Test BMW buttons."""
 
+import asyncio
+from copy import deepcopy
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from bimmer_connected.models import MyBMWRemoteServiceError
@@ -8,18 +11,24 @@ import pytest
 import respx
 from syrupy.assertion import SnapshotAssertion
 
+from homeassistant.components.bmw_connected_drive.const import (
+    CONF_BACKGROUND_COMMANDS,
+    EVENT_REMOTE_COMMAND,
+)
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
 from . import (
+    FIXTURE_CONFIG_ENTRY,
+    REMOTE_SERVICE_EXC_REASON,
     REMOTE_SERVICE_EXC_TRANSLATION,
     check_remote_service_call,
     setup_mocked_integration,
 )
 
-from tests.common import snapshot_platform
+from tests.common import MockConfigEntry, async_capture_events, snapshot_platform
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -101,6 +110,61 @@ async def test_service_call_fail(
     assert hass.states.get(entity_id).state == old_value
 
 
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_background(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test button press returning before the remote service finished."""
+
+    # Setup component with remote commands running in the background
+    config_entry = deepcopy(FIXTURE_CONFIG_ENTRY)
+    config_entry["options"] = {
+        **config_entry["options"],
+        CONF_BACKGROUND_COMMANDS: True,
+    }
+    mock_config_entry = MockConfigEntry(**config_entry)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    status_entity_id = "sensor.i4_edrive40_last_remote_command"
+    assert hass.states.get(status_entity_id).state == "unknown"
+    events = async_capture_events(hass, EVENT_REMOTE_COMMAND)
+
+    # Setup a remote service that fails after a while
+    release_service = asyncio.Event()
+
+    async def _trigger_remote_service(*args: Any, **kwargs: Any) -> None:
+        await release_service.wait()
+        raise MyBMWRemoteServiceError(REMOTE_SERVICE_EXC_REASON)
+
+    monkeypatch.setattr(
+        RemoteServices, "trigger_remote_service", _trigger_remote_service
+    )
+
+    # Test
+    await hass.services.async_call(
+        "button",
+        "press",
+        blocking=True,
+        target={"entity_id": "button.i4_edrive40_sound_horn"},
+    )
+    assert hass.states.get(status_entity_id).state == "pending"
+    assert not events
+
+    release_service.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get(status_entity_id)
+    assert state.state == "failed"
+    assert state.attributes["command"] == "horn"
+    assert state.attributes["error"] == REMOTE_SERVICE_EXC_REASON
+    assert len(events) == 1
+    assert events[0].data["command"] == "horn"
+    assert events[0].data["state"] == "failed"
+
+
 @pytest.mark.parametrize(
     (
         "entity_id",
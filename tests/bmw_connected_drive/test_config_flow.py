@@ -11,9 +11,12 @@ import pytest
 from homeassistant import config_entries
 from homeassistant.components.bmw_connected_drive.config_flow import DOMAIN
 from homeassistant.components.bmw_connected_drive.const import (
+    CONF_BACKGROUND_COMMANDS,
     CONF_CAPTCHA_TOKEN,
+    CONF_COMMAND_REFRESH_DELAY,
     CONF_READ_ONLY,
     CONF_REFRESH_TOKEN,
+    CONF_SKIP_REDUNDANT_COMMANDS,
 )
 from homeassistant.const import CONF_PASSWORD, CONF_REGION, CONF_USERNAME
 from homeassistant.core import HomeAssistant
@@ -217,6 +220,9 @@ async def test_options_flow_implementation(hass: HomeAssistant) -> None:
         assert result["type"] is FlowResultType.CREATE_ENTRY
         assert result["data"] == {
             CONF_READ_ONLY: True,
+            CONF_BACKGROUND_COMMANDS: False,
+            CONF_COMMAND_REFRESH_DELAY: 0,
+            CONF_SKIP_REDUNDANT_COMMANDS: False,
         }
 
         assert len(mock_setup_entry.mock_calls) == 2
@@ -1,8 +1,12 @@
 """Test BMW coordinator for general availability/unavailability of entities and raising issues."""
 
+import asyncio
 from copy import deepcopy
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
+from bimmer_connected.account import MyBMWAccount
 from bimmer_connected.models import (
     MyBMWAPIError,
     MyBMWAuthError,
@@ -10,17 +14,40 @@ from bimmer_connected.models import (
 )
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+import respx
 
 from homeassistant.components.bmw_connected_drive import DOMAIN
+from homeassistant.components.bmw_connected_drive.commands import RemoteCommand
 from homeassistant.components.bmw_connected_drive.const import (
     CONF_REFRESH_TOKEN,
     SCAN_INTERVALS,
 )
-from homeassistant.const import CONF_REGION
+from homeassistant.components.bmw_connected_drive.coordinator import (
+    REFRESH_TOKEN_SAVE_COOLDOWN,
+    SNAPSHOT_SAVE_DELAY,
+    TOKEN_REFRESH_RETRY,
+)
+from homeassistant.components.bmw_connected_drive.quota import (
+    MAX_POLL_STRETCH,
+    daily_request_budget,
+    estimate_poll_requests,
+)
+from homeassistant.components.bmw_connected_drive.scheduler import (
+    IDLE_AFTER,
+    IDLE_INTERVAL_FACTOR,
+    BreakerState,
+)
+from homeassistant.const import CONF_REGION, STATE_UNKNOWN
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, HomeAssistant
-from homeassistant.helpers import issue_registry as ir
-
-from . import BIMMER_CONNECTED_VEHICLE_PATCH, FIXTURE_CONFIG_ENTRY
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import device_registry as dr, issue_registry as ir
+from homeassistant.util import dt as dt_util
+
+from . import (
+    BIMMER_CONNECTED_VEHICLE_PATCH,
+    FIXTURE_CONFIG_ENTRY,
+    setup_mocked_integration,
+)
 
 from tests.common import MockConfigEntry, async_fire_time_changed
 
@@ -242,3 +269,726 @@ async def test_captcha_reauth(
     assert flow["handler"] == DOMAIN
     assert flow["context"]["source"] == "reauth"
     assert flow["context"]["unique_id"] == config_entry.unique_id
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_adaptive_vehicle_polling(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test charging vehicles being polled more often than idle vehicles."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = config_entry.runtime_data
+    scan_interval = timedelta(seconds=SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+
+    # Without idle vehicles, all vehicles are polled at the region interval
+    intervals = coordinator.scheduler.intervals(dt_util.utcnow())
+    assert set(intervals.values()) == {scan_interval}
+    assert coordinator.update_interval == scan_interval
+
+    # Vehicle data from fixtures never changes, so parked vehicles become idle
+    for _ in range(IDLE_AFTER // scan_interval + 1):
+        freezer.tick(scan_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    intervals = coordinator.scheduler.intervals(dt_util.utcnow())
+    # iX xDrive50 is charging
+    assert intervals["WBA00000000DEMO01"] < scan_interval
+    assert intervals["WBA00000000DEMO02"] == scan_interval * IDLE_INTERVAL_FACTOR
+    assert intervals["WBY00000000REXI01"] == scan_interval * IDLE_INTERVAL_FACTOR
+
+    # The account never polls more often than with the fixed region interval
+    assert sum(scan_interval / interval for interval in intervals.values()) <= len(
+        intervals
+    )
+    assert coordinator.update_interval < scan_interval
+
+
+async def test_only_changed_entities_updated(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    bmw_fixture: respx.Router,
+) -> None:
+    """Test that only entities of changed vehicle data are updated."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    mileage_entity_id = "sensor.i3_rex_mileage"
+    lids_entity_id = "binary_sensor.i3_rex_lids"
+    other_vehicle_entity_id = "sensor.i4_edrive40_mileage"
+    before = {
+        entity_id: hass.states.get(entity_id)
+        for entity_id in (mileage_entity_id, lids_entity_id, other_vehicle_entity_id)
+    }
+
+    # Unchanged vehicle data does not write any states
+    freezer.tick(SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    for entity_id, state in before.items():
+        assert hass.states.get(entity_id).last_reported == state.last_reported
+
+    # Only entities depending on the changed data are updated
+    vehicle_state = bmw_fixture.states["WBY00000000REXI01"]["state"]
+    vehicle_state["currentMileage"] += 10
+    vehicle_state["lastFetched"] = dt_util.utcnow().isoformat()
+
+    freezer.tick(SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(mileage_entity_id).state == str(
+        int(before[mileage_entity_id].state) + 10
+    )
+    for entity_id in (lids_entity_id, other_vehicle_entity_id):
+        assert (
+            hass.states.get(entity_id).last_reported == before[entity_id].last_reported
+        )
+
+
+async def test_changes_without_new_timestamp(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    bmw_fixture: respx.Router,
+) -> None:
+    """Test capability changes are detected without a new vehicle timestamp."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    tracker_entity_id = "device_tracker.i4_edrive40"
+    assert hass.states.get(tracker_entity_id).state != STATE_UNKNOWN
+
+    # Disabling the vehicle finder does not update the timestamp
+    bmw_fixture.states["WBA00000000DEMO02"]["capabilities"]["vehicleFinder"] = False
+
+    freezer.tick(SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(tracker_entity_id).state == STATE_UNKNOWN
+
+
+async def test_unchanged_entities_not_written(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    bmw_fixture: respx.Router,
+) -> None:
+    """Test that entities of changed vehicle data only write changed states."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    battery_entity_id = "sensor.i3_rex_remaining_battery_percent"
+    status_entity_id = "sensor.i3_rex_charging_status"
+    status_before = hass.states.get(status_entity_id)
+
+    # Both entities depend on the changed fuel and battery data
+    vehicle_state = bmw_fixture.states["WBY00000000REXI01"]["state"]
+    vehicle_state["electricChargingState"]["chargingLevelPercent"] = 90
+    vehicle_state["lastFetched"] = dt_util.utcnow().isoformat()
+
+    freezer.tick(SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(battery_entity_id).state == "90"
+    assert hass.states.get(status_entity_id) is status_before
+    assert (
+        hass.states.get(status_entity_id).last_reported == status_before.last_reported
+    )
+
+    # States changed outside of the entity are written again
+    hass.states.async_set(status_entity_id, "charging")
+    config_entry.runtime_data.async_update_listeners()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(status_entity_id).state == status_before.state
+
+
+async def test_restore_snapshot(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    bmw_fixture: respx.Router,
+) -> None:
+    """Test entities are restored from the snapshot before the first poll."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(seconds=SNAPSHOT_SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert len(hass_storage[f"{DOMAIN}.{config_entry.entry_id}"]["data"]["vehicles"])
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Keep the API from answering while the entry is set up again
+    poll_started = asyncio.Event()
+    release_poll = asyncio.Event()
+
+    get_vehicles = MyBMWAccount.get_vehicles
+
+    async def _blocked_get_vehicles(
+        self: MyBMWAccount, *args: Any, **kwargs: Any
+    ) -> None:
+        poll_started.set()
+        await release_poll.wait()
+        await get_vehicles(self, *args, **kwargs)
+
+    vehicle_list_calls = bmw_fixture.routes["vehicles"].call_count
+    with patch(BIMMER_CONNECTED_VEHICLE_PATCH, _blocked_get_vehicles):
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await poll_started.wait()
+
+        coordinator = config_entry.runtime_data
+        assert coordinator.is_stale
+        for entity_id, state in FIXTURE_ENTITY_STATES.items():
+            assert hass.states.get(entity_id).state == state
+            assert hass.states.get(entity_id).attributes["stale"] is True
+
+        release_poll.set()
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert not coordinator.is_stale
+    assert coordinator.last_update_success
+    for entity_id in FIXTURE_ENTITY_STATES:
+        assert "stale" not in hass.states.get(entity_id).attributes
+    # The restored vehicle list is fetched again
+    assert bmw_fixture.routes["vehicles"].call_count > vehicle_list_calls
+    assert (
+        hass.states.get("sensor.user_domain_com_remaining_api_requests").attributes[
+            "stale"
+        ]
+        is False
+    )
+
+    await hass.config_entries.async_remove(config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert f"{DOMAIN}.{config_entry.entry_id}" not in hass_storage
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_restore_snapshot_vehicles_changed(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test vehicles removed since the snapshot was saved are dropped."""
+    config_entry = MockConfigEntry(**FIXTURE_CONFIG_ENTRY)
+    config_entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    freezer.tick(timedelta(seconds=SNAPSHOT_SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    # Add a vehicle to the snapshot that is no longer part of the account
+    snapshot = hass_storage[f"{DOMAIN}.{config_entry.entry_id}"]["data"]
+    removed_vehicle = deepcopy(snapshot["vehicles"][0])
+    removed_vehicle["vin"] = "WBA00000000GONE1"
+    snapshot["vehicles"].append(removed_vehicle)
+
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    coordinator = config_entry.runtime_data
+    assert not coordinator.is_stale
+    assert coordinator.account.get_vehicle("WBA00000000GONE1") is None
+    assert device_registry.async_get_device({(DOMAIN, "WBA00000000GONE1")}) is None
+    assert all(
+        vehicle["vin"] != "WBA00000000GONE1"
+        for vehicle in hass_storage[f"{DOMAIN}.{config_entry.entry_id}"]["data"][
+            "vehicles"
+        ]
+    )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_request_budget(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test polls are stretched and skipped if the request budget runs low."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    quota = coordinator.quota
+    scan_interval = timedelta(seconds=SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+
+    # The budget is sized for the vehicles of the account, polls at the
+    # region's interval only use part of what refills
+    assert quota.capacity == daily_request_budget(
+        len(coordinator.account.vehicles), scan_interval
+    )
+    freezer.tick(scan_interval)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    now = dt_util.utcnow()
+    assert coordinator.update_interval <= scan_interval
+    assert quota.remaining(now) >= quota.capacity - estimate_poll_requests(
+        len(coordinator.account.vehicles), vehicle_list=True
+    )
+    assert quota.poll_interval_factor(now) == 1
+
+    # A quota error leaves only the budget reserved for remote commands
+    quota.exhaust(now)
+    assert quota.remaining(now) <= quota.reserve
+
+    # Polls may only use the budget above the reserve. The budget refilled
+    # while waiting for the next poll stays below it.
+    quota.consume(quota.remaining(now), now)
+    assert quota.remaining(now + scan_interval) < quota.reserve
+
+    with patch(BIMMER_CONNECTED_VEHICLE_PATCH) as mock_get_vehicles:
+        freezer.tick(scan_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    mock_get_vehicles.assert_not_called()
+    assert coordinator.last_update_success
+    assert coordinator.update_interval == scan_interval * MAX_POLL_STRETCH
+    assert hass.states.get("lock.i3_rex_lock").state == "unlocked"
+
+    # Remote commands can use the reserve, but not more
+    await hass.services.async_call(
+        "button",
+        "press",
+        blocking=True,
+        target={"entity_id": "button.i3_rex_flash_lights"},
+    )
+
+    quota.consume(quota.remaining(dt_util.utcnow()), dt_util.utcnow())
+    with pytest.raises(
+        HomeAssistantError, match="request budget of the account is exhausted"
+    ):
+        await hass.services.async_call(
+            "button",
+            "press",
+            blocking=True,
+            target={"entity_id": "button.i3_rex_flash_lights"},
+        )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_poll_backoff(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test polls are backed off while the API keeps failing."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    scan_interval = timedelta(seconds=SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+
+    # The first failure is retried at the regular interval, then polls back off
+    for breaker_state, update_interval in (
+        (BreakerState.CLOSED, scan_interval),
+        (BreakerState.OPEN, scan_interval * 2),
+    ):
+        freezer.tick(scan_interval)
+        with (
+            patch(
+                BIMMER_CONNECTED_VEHICLE_PATCH,
+                side_effect=MyBMWAPIError("Test error"),
+            ),
+            patch(
+                "homeassistant.components.bmw_connected_drive.scheduler.random.uniform",
+                return_value=1,
+            ),
+        ):
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+
+        assert coordinator.breaker.state is breaker_state
+        assert coordinator.update_interval == update_interval
+
+    # No poll while the breaker is open, neither scheduled nor requested ones
+    with patch(BIMMER_CONNECTED_VEHICLE_PATCH) as mock_get_vehicles:
+        freezer.tick(scan_interval)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+        await coordinator.async_refresh()
+        with pytest.raises(HomeAssistantError, match="paused"):
+            await hass.services.async_call(
+                DOMAIN, "update_state", {"vin": "WBA00000000DEMO02"}, blocking=True
+            )
+    mock_get_vehicles.assert_not_called()
+    assert coordinator.breaker.state is BreakerState.OPEN
+    assert coordinator.update_interval == scan_interval
+
+    # A successful probe restores the regular cadence
+    freezer.tick(scan_interval)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert coordinator.breaker.state is BreakerState.CLOSED
+    assert coordinator.update_interval == scan_interval
+    for entity_id, state in FIXTURE_ENTITY_STATES.items():
+        assert hass.states.get(entity_id).state == state
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_accounts_polls_staggered(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the polls of multiple accounts are spread across the interval."""
+    scan_interval = timedelta(seconds=SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+
+    config_entries = []
+    for index in range(2):
+        config_entry_fixture = deepcopy(FIXTURE_CONFIG_ENTRY)
+        config_entry_fixture["entry_id"] = f"{index}"
+        config_entry_fixture["unique_id"] = f"{index}-{FIXTURE_DEFAULT_REGION}"
+        config_entry = MockConfigEntry(**config_entry_fixture)
+        config_entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(config_entry.entry_id)
+        await hass.async_block_till_done()
+        config_entries.append(config_entry)
+
+    first, second = (entry.runtime_data.scheduler for entry in config_entries)
+    assert (second.next_poll() - first.next_poll()) % scan_interval == (
+        scan_interval / 2
+    )
+
+    # The phase is kept across polls
+    for _ in range(4):
+        freezer.tick(scan_interval / 2)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert (second.next_poll() - first.next_poll()) % scan_interval == (
+        scan_interval / 2
+    )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_refresh_token_writes_debounced(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test rotated refresh tokens are written once per window and on unload."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    assert config_entry.data[CONF_REFRESH_TOKEN] == "another_token_string"
+
+    async def _rotate_refresh_token(*args: Any, **kwargs: Any) -> None:
+        authentication = coordinator.account.config.authentication
+        authentication.refresh_token = f"{authentication.refresh_token}_rotated"
+
+    async def _async_poll_rotating() -> None:
+        freezer.tick(SCAN_INTERVALS[FIXTURE_DEFAULT_REGION])
+        with patch(BIMMER_CONNECTED_VEHICLE_PATCH, side_effect=_rotate_refresh_token):
+            async_fire_time_changed(hass)
+            await hass.async_block_till_done()
+        assert coordinator.last_update_success
+
+    # The first rotation is written right away
+    await _async_poll_rotating()
+    assert config_entry.data[CONF_REFRESH_TOKEN] == "another_token_string_rotated"
+
+    # Further rotations within the window are written at its end
+    await _async_poll_rotating()
+    assert config_entry.data[CONF_REFRESH_TOKEN] == "another_token_string_rotated"
+
+    freezer.tick(REFRESH_TOKEN_SAVE_COOLDOWN)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert (
+        config_entry.data[CONF_REFRESH_TOKEN] == "another_token_string_rotated_rotated"
+    )
+
+    # A pending rotation is written on unload
+    await _async_poll_rotating()
+    assert (
+        config_entry.data[CONF_REFRESH_TOKEN] == "another_token_string_rotated_rotated"
+    )
+
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert config_entry.data[CONF_REFRESH_TOKEN] == (
+        "another_token_string_rotated_rotated_rotated"
+    )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_access_token_refreshed_ahead(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the access token is refreshed in the background before it expires."""
+    # Refresh the token right after setup
+    with patch(
+        "homeassistant.components.bmw_connected_drive.coordinator.TOKEN_REFRESH_AHEAD",
+        timedelta(days=1),
+    ):
+        config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    authentication = coordinator.account.config.authentication
+
+    expires_at = authentication.expires_at
+    authentication.access_token = "old_access_token"
+
+    freezer.tick(TOKEN_REFRESH_RETRY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert authentication.access_token != "old_access_token"
+    assert authentication.expires_at > expires_at
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_access_token_refresh_auth_failed(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test a failed background token refresh is handled by the next poll."""
+    with patch(
+        "homeassistant.components.bmw_connected_drive.coordinator.TOKEN_REFRESH_AHEAD",
+        timedelta(days=1),
+    ):
+        config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    authentication = coordinator.account.config.authentication
+
+    freezer.tick(TOKEN_REFRESH_RETRY)
+    with (
+        patch.object(
+            authentication, "login", side_effect=MyBMWAuthError("Test error")
+        ) as mock_login,
+        patch(
+            BIMMER_CONNECTED_VEHICLE_PATCH, side_effect=MyBMWAuthError("Test error")
+        ) as mock_get_vehicles,
+    ):
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    # The poll requested by the token refresh runs into the same error
+    mock_login.assert_called_once()
+    mock_get_vehicles.assert_called_once()
+    assert not coordinator.last_update_success
+    for entity_id in FIXTURE_ENTITY_STATES:
+        assert hass.states.get(entity_id).state == "unavailable"
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_fetch_vehicles_single_flight(
+    hass: HomeAssistant,
+) -> None:
+    """Test concurrent fetches share one request and recent data is reused."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+
+    release_fetch = asyncio.Event()
+
+    async def _blocked_get_vehicles(*args: Any, **kwargs: Any) -> None:
+        assert coordinator.account.config.log_responses
+        await release_fetch.wait()
+
+    with patch(
+        BIMMER_CONNECTED_VEHICLE_PATCH, side_effect=_blocked_get_vehicles
+    ) as mock_get_vehicles:
+        fetches = [
+            hass.async_create_task(
+                coordinator.async_fetch_vehicles(log_responses=log_responses)
+            )
+            for log_responses in (True, True, False)
+        ]
+        await asyncio.sleep(0)
+        release_fetch.set()
+        await asyncio.gather(*fetches)
+
+        mock_get_vehicles.assert_called_once_with(force_init=True)
+        assert not coordinator.account.config.log_responses
+
+        # Data fetched within the freshness window is reused
+        await coordinator.async_fetch_vehicles(
+            log_responses=True, max_age=timedelta(minutes=1)
+        )
+        mock_get_vehicles.assert_called_once()
+
+    with patch(BIMMER_CONNECTED_VEHICLE_PATCH) as mock_get_vehicles:
+        await coordinator.async_fetch_vehicles()
+        mock_get_vehicles.assert_called_once_with(force_init=False)
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_remote_commands_serialized(
+    hass: HomeAssistant,
+) -> None:
+    """Test remote commands of a vehicle run one by one by priority."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    vin = "WBA00000000DEMO01"
+
+    release_first = asyncio.Event()
+    executed: list[str] = []
+
+    async def _action(name: str) -> str:
+        executed.append(name)
+        if name == "horn":
+            await release_first.wait()
+        return name
+
+    def _execute(command: RemoteCommand, name: str) -> asyncio.Task[str]:
+        return hass.async_create_task(
+            coordinator.async_execute_remote_command(
+                vin, command, lambda: _action(name)
+            )
+        )
+
+    horn = _execute(RemoteCommand.HORN, "horn")
+    await asyncio.sleep(0)
+    climate_on = _execute(RemoteCommand.CLIMATE, "climate_on")
+    charging = _execute(RemoteCommand.CHARGING, "charging")
+    lock = _execute(RemoteCommand.DOOR_LOCK, "lock")
+    climate_off = _execute(RemoteCommand.CLIMATE, "climate_off")
+    await asyncio.sleep(0)
+
+    # Only the first command is running, the others are waiting
+    assert executed == ["horn"]
+    assert coordinator.command_queue_depth(vin) == 4
+    with pytest.raises(HomeAssistantError):
+        await climate_on
+
+    release_first.set()
+    assert await asyncio.gather(horn, charging, lock, climate_off) == [
+        "horn",
+        "charging",
+        "lock",
+        "climate_off",
+    ]
+    assert executed == ["horn", "lock", "charging", "climate_off"]
+    assert coordinator.command_queue_depth(vin) == 0
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_repeated_commands_not_superseded(
+    hass: HomeAssistant,
+) -> None:
+    """Test commands not setting a state are all executed."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    vin = "WBA00000000DEMO01"
+
+    release_first = asyncio.Event()
+    executed: list[str] = []
+
+    async def _action(name: str) -> str:
+        executed.append(name)
+        if name == "lock":
+            await release_first.wait()
+        return name
+
+    def _execute(command: RemoteCommand, name: str) -> asyncio.Task[str]:
+        return hass.async_create_task(
+            coordinator.async_execute_remote_command(
+                vin, command, lambda: _action(name)
+            )
+        )
+
+    lock = _execute(RemoteCommand.DOOR_LOCK, "lock")
+    await asyncio.sleep(0)
+    first_poi = _execute(RemoteCommand.SEND_POI, "first_poi")
+    second_poi = _execute(RemoteCommand.SEND_POI, "second_poi")
+    await asyncio.sleep(0)
+
+    release_first.set()
+    assert await asyncio.gather(lock, first_poi, second_poi) == [
+        "lock",
+        "first_poi",
+        "second_poi",
+    ]
+    assert executed == ["lock", "first_poi", "second_poi"]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_cancelled_command_not_sent(
+    hass: HomeAssistant,
+) -> None:
+    """Test a queued command is dropped if its caller stopped waiting."""
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    vin = "WBA00000000DEMO01"
+
+    release_first = asyncio.Event()
+    executed: list[str] = []
+
+    async def _action(name: str) -> None:
+        executed.append(name)
+        if name == "lock":
+            await release_first.wait()
+
+    lock = hass.async_create_task(
+        coordinator.async_execute_remote_command(
+            vin, RemoteCommand.DOOR_LOCK, lambda: _action("lock")
+        )
+    )
+    await asyncio.sleep(0)
+    horn = hass.async_create_task(
+        coordinator.async_execute_remote_command(
+            vin, RemoteCommand.HORN, lambda: _action("horn")
+        )
+    )
+    await asyncio.sleep(0)
+
+    # The caller of the queued command gives up, e.g. on a timeout
+    horn.cancel()
+    release_first.set()
+    await lock
+    await hass.async_block_till_done()
+
+    assert horn.cancelled()
+    assert executed == ["lock"]
+    assert coordinator.command_queue_depth(vin) == 0
+
+
+async def test_remote_command_refreshes_vehicle(
+    hass: HomeAssistant,
+    bmw_fixture: respx.Router,
+) -> None:
+    """Test only the vehicle changed by a remote command is fetched again."""
+    await setup_mocked_integration(hass)
+    assert hass.states.get("lock.i3_rex_lock").state == "unlocked"
+    state_calls = bmw_fixture.routes["state"].call_count
+
+    with patch(BIMMER_CONNECTED_VEHICLE_PATCH) as mock_get_vehicles:
+        await hass.services.async_call(
+            "lock",
+            "lock",
+            blocking=True,
+            target={"entity_id": "lock.i3_rex_lock"},
+        )
+
+    mock_get_vehicles.assert_not_called()
+    assert [
+        call.request.headers["bmw-vin"]
+        for call in bmw_fixture.routes["state"].calls[state_calls:]
+    ] == ["WBY00000000REXI01"]
+    assert hass.states.get("lock.i3_rex_lock").state == "locked"
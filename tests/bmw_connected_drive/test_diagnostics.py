@@ -90,3 +90,52 @@ async def test_device_diagnostics_vehicle_not_found(
     )
 
     assert diagnostics == snapshot
+
+
+@pytest.mark.freeze_time(datetime.datetime(2022, 7, 10, 11, tzinfo=datetime.UTC))
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_diagnostics_downloaded_twice(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+) -> None:
+    """Test diagnostics reusing a recent fetch keep its responses."""
+
+    mock_config_entry = await setup_mocked_integration(hass)
+
+    first = await get_diagnostics_for_config_entry(hass, hass_client, mock_config_entry)
+    second = await get_diagnostics_for_config_entry(
+        hass, hass_client, mock_config_entry
+    )
+
+    assert first["fingerprint"]
+    assert second["fingerprint"] == first["fingerprint"]
+
+
+@pytest.mark.freeze_time(datetime.datetime(2022, 7, 10, 11, tzinfo=datetime.UTC))
+@pytest.mark.usefixtures("bmw_fixture")
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_device_diagnostics_account(
+    hass: HomeAssistant,
+    hass_client: ClientSessionGenerator,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test device diagnostics of the service device of an account."""
+
+    mock_config_entry = await setup_mocked_integration(hass)
+
+    reg_device = device_registry.async_get_device(
+        identifiers={(DOMAIN, mock_config_entry.unique_id)},
+    )
+    assert reg_device is not None
+
+    diagnostics = await get_diagnostics_for_device(
+        hass, hass_client, mock_config_entry, reg_device
+    )
+
+    assert "data" not in diagnostics
+    assert diagnostics["coordinator"]["breaker"]["state"] == "closed"
+    assert diagnostics["request_budget"] == {
+        "capacity": 4608,
+        "reserve": 460,
+        "remaining": 4593,
+    }
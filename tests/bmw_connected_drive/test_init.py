@@ -11,7 +11,11 @@ from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 
-from . import BIMMER_CONNECTED_VEHICLE_PATCH, FIXTURE_CONFIG_ENTRY
+from . import (
+    BIMMER_CONNECTED_VEHICLE_PATCH,
+    FIXTURE_CONFIG_ENTRY,
+    setup_mocked_integration,
+)
 
 from tests.common import MockConfigEntry
 
@@ -259,3 +263,28 @@ async def test_remove_stale_devices(
     assert len(device_entries) > 0
     remaining_device_identifiers = set().union(*(d.identifiers for d in device_entries))
     assert not {(DOMAIN, "stale_device_id")}.intersection(remaining_device_identifiers)
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_shared_device_info(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test all entities of a vehicle share one device info."""
+    mock_config_entry = await setup_mocked_integration(hass)
+    coordinator = mock_config_entry.runtime_data
+
+    for vehicle in coordinator.account.vehicles:
+        device_info = coordinator.get_device_info(vehicle)
+        assert coordinator.get_device_info(vehicle) is device_info
+        assert device_info["identifiers"] == {(DOMAIN, vehicle.vin)}
+        assert device_info["name"] == vehicle.name
+
+    vehicle_devices = [
+        device
+        for device in dr.async_entries_for_config_entry(
+            device_registry, mock_config_entry.entry_id
+        )
+        if device.serial_number is not None
+    ]
+    assert len(vehicle_devices) == len(coordinator.account.vehicles)
@@ -1,14 +1,25 @@
 """Test BMW locks."""
 
+import asyncio
+from copy import deepcopy
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from bimmer_connected.models import MyBMWRemoteServiceError
 from bimmer_connected.vehicle.remote_services import RemoteServices
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import respx
 from syrupy.assertion import SnapshotAssertion
 
+from homeassistant.components.bmw_connected_drive.const import (
+    CONF_SKIP_REDUNDANT_COMMANDS,
+    EVENT_REMOTE_COMMAND,
+)
+from homeassistant.components.bmw_connected_drive.coordinator import (
+    REDUNDANT_COMMAND_MAX_AGE,
+)
 from homeassistant.components.recorder.history import get_significant_states
 from homeassistant.const import STATE_UNKNOWN, Platform
 from homeassistant.core import HomeAssistant
@@ -17,13 +28,14 @@ from homeassistant.helpers import entity_registry as er
 from homeassistant.util import dt as dt_util
 
 from . import (
+    FIXTURE_CONFIG_ENTRY,
     REMOTE_SERVICE_EXC_REASON,
     REMOTE_SERVICE_EXC_TRANSLATION,
     check_remote_service_call,
     setup_mocked_integration,
 )
 
-from tests.common import snapshot_platform
+from tests.common import MockConfigEntry, async_capture_events, snapshot_platform
 from tests.components.recorder.common import async_wait_recording_done
 
 
@@ -142,3 +154,134 @@ async def test_service_call_fail(
         get_significant_states, hass, now, None, [entity_id]
     )
     assert states[entity_id][-2].state == STATE_UNKNOWN
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_error_discards_optimistic_state(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the vehicle state is shown again if a command raises an error."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+    entity_id = "lock.m340i_xdrive_lock"
+    assert hass.states.get(entity_id).state == "locked"
+
+    # Setup exception
+    monkeypatch.setattr(
+        RemoteServices,
+        "trigger_remote_service",
+        AsyncMock(side_effect=HomeAssistantError("Test error")),
+    )
+
+    # Test
+    with pytest.raises(HomeAssistantError, match="Test error"):
+        await hass.services.async_call(
+            "lock",
+            "unlock",
+            blocking=True,
+            target={"entity_id": entity_id},
+        )
+    assert hass.states.get(entity_id).state == "locked"
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_vehicles_in_parallel(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test commands to different vehicles are not serialized."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+
+    # Setup remote services which only finish once all vehicles were reached
+    all_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _trigger_remote_service(
+        self: RemoteServices, *args: Any, **kwargs: Any
+    ) -> None:
+        started.append(self._vehicle.vin)
+        if len(started) == 2:
+            all_started.set()
+        await all_started.wait()
+
+    monkeypatch.setattr(
+        RemoteServices, "trigger_remote_service", _trigger_remote_service
+    )
+
+    # Test
+    async with asyncio.timeout(5):
+        await hass.services.async_call(
+            "lock",
+            "lock",
+            blocking=True,
+            target={"entity_id": ["lock.m340i_xdrive_lock", "lock.i3_rex_lock"]},
+        )
+    assert sorted(started) == ["WBA00000000DEMO03", "WBY00000000REXI01"]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_skip_redundant(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test commands are not sent if the vehicle is already in the target state."""
+
+    # Setup component with redundant commands being skipped
+    config_entry = deepcopy(FIXTURE_CONFIG_ENTRY)
+    config_entry["options"] = {
+        **config_entry["options"],
+        CONF_SKIP_REDUNDANT_COMMANDS: True,
+    }
+    mock_config_entry = MockConfigEntry(**config_entry)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "lock.m340i_xdrive_lock"
+    assert hass.states.get(entity_id).state == "locked"
+    events = async_capture_events(hass, EVENT_REMOTE_COMMAND)
+
+    # Record the sent remote services
+    triggered: list[str] = []
+    trigger_remote_service = RemoteServices.trigger_remote_service
+
+    async def _trigger_remote_service(
+        self: RemoteServices, service_id: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        triggered.append(service_id)
+        return await trigger_remote_service(self, service_id, *args, **kwargs)
+
+    monkeypatch.setattr(
+        RemoteServices, "trigger_remote_service", _trigger_remote_service
+    )
+
+    async def _async_call(service: str) -> None:
+        await hass.services.async_call(
+            "lock", service, blocking=True, target={"entity_id": entity_id}
+        )
+
+    # Locking a locked vehicle is skipped
+    await _async_call("lock")
+    assert triggered == []
+    assert events[-1].data["state"] == "skipped"
+    assert hass.states.get(entity_id).state == "locked"
+    assert hass.states.get("sensor.m340i_xdrive_last_remote_command").state == "skipped"
+
+    # Commands are not skipped based on outdated data
+    freezer.tick(REDUNDANT_COMMAND_MAX_AGE)
+    freezer.tick(1)
+    await _async_call("lock")
+    assert triggered == ["door-lock"]
+
+    # Unlocking is sent
+    await _async_call("unlock")
+    assert triggered == ["door-lock", "door-unlock"]
+
+    # The state fetched with the unlock command may not include it yet
+    await _async_call("lock")
+    assert triggered == ["door-lock", "door-unlock", "door-lock"]
@@ -1,5 +1,7 @@
 """Test BMW numbers."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock
 
 from bimmer_connected.models import MyBMWAPIError, MyBMWRemoteServiceError
@@ -8,10 +10,12 @@ from bimmer_connected.vehicle.remote_services import RemoteServices
 import pytest
 import respx
 
+from homeassistant.components.bmw_connected_drive.commands import RemoteCommand
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 
 from . import (
+    REMOTE_SERVICE_EXC_REASON,
     REMOTE_SERVICE_EXC_TRANSLATION,
     check_remote_service_call,
     setup_mocked_integration,
@@ -152,3 +156,108 @@ async def test_service_call_fail(
             },
             blocking=True,
         )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_multiple_targets(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failing vehicle does not stop sending the POI to the others."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+
+    # Setup exception for a single vehicle
+    sent_to: list[str] = []
+
+    async def _trigger_send_poi(self: RemoteServices, poi: Any) -> None:
+        if self._vehicle.name == "i4 eDrive40":
+            raise MyBMWRemoteServiceError(REMOTE_SERVICE_EXC_REASON)
+        sent_to.append(self._vehicle.name)
+
+    monkeypatch.setattr(RemoteServices, "trigger_send_poi", _trigger_send_poi)
+
+    # Test
+    with pytest.raises(
+        HomeAssistantError, match=f"i4 eDrive40: {REMOTE_SERVICE_EXC_REASON}"
+    ):
+        await hass.services.async_call(
+            "notify",
+            "bmw_connected_drive",
+            {
+                "message": POI_DATA.get("name"),
+                "target": ["iX xDrive50", "i4 eDrive40", "M340i xDrive"],
+                "data": {
+                    "latitude": POI_DATA.get("lat"),
+                    "longitude": POI_DATA.get("lon"),
+                },
+            },
+            blocking=True,
+        )
+    assert sorted(sent_to) == ["M340i xDrive", "iX xDrive50"]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_unknown_target(
+    hass: HomeAssistant,
+) -> None:
+    """Test an unknown target name is rejected."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+
+    # Test
+    with pytest.raises(ServiceValidationError, match="Unknown car"):
+        await hass.services.async_call(
+            "notify",
+            "bmw_connected_drive",
+            {
+                "message": POI_DATA.get("name"),
+                "target": ["iX xDrive50", "Unknown car"],
+                "data": {
+                    "latitude": POI_DATA.get("lat"),
+                    "longitude": POI_DATA.get("lon"),
+                },
+            },
+            blocking=True,
+        )
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_queued_behind_command(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test waiting behind another command does not count towards the timeout."""
+
+    # Setup component
+    config_entry = await setup_mocked_integration(hass)
+    coordinator = config_entry.runtime_data
+    monkeypatch.setattr(
+        "homeassistant.components.bmw_connected_drive.notify.POI_SEND_TIMEOUT", 0.05
+    )
+
+    # Block the vehicle with a slow command
+    vehicle = coordinator.account.get_vehicle("WBA00000000DEMO01")
+    slow_command = hass.async_create_task(
+        coordinator.async_execute_remote_command(
+            vehicle.vin, RemoteCommand.DOOR_LOCK, lambda: asyncio.sleep(0.1)
+        )
+    )
+    await asyncio.sleep(0)
+
+    # Test
+    await hass.services.async_call(
+        "notify",
+        "bmw_connected_drive_ix_xdrive50",
+        {
+            "message": POI_DATA.get("name"),
+            "data": {
+                "latitude": POI_DATA.get("lat"),
+                "longitude": POI_DATA.get("lon"),
+            },
+        },
+        blocking=True,
+    )
+    assert slow_command.done()
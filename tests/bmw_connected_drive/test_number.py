@@ -1,13 +1,17 @@
 """Test BMW numbers."""
 
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from bimmer_connected.models import MyBMWAPIError, MyBMWRemoteServiceError
 from bimmer_connected.vehicle.remote_services import RemoteServices
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import respx
 from syrupy.assertion import SnapshotAssertion
 
+from homeassistant.components.bmw_connected_drive import coordinator
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
@@ -20,7 +24,7 @@ from . import (
     setup_mocked_integration,
 )
 
-from tests.common import snapshot_platform
+from tests.common import async_fire_time_changed, snapshot_platform
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -162,3 +166,66 @@ async def test_service_call_fail(
             target={"entity_id": entity_id},
         )
     assert hass.states.get(entity_id).state == old_value
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_merged(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test charging settings changed in quick succession are sent together."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+    monkeypatch.setattr(coordinator, "CHARGING_SETTINGS_DEBOUNCE", 3)
+
+    # Record the sent charging settings
+    updates: list[dict[str, Any]] = []
+    trigger_charging_settings_update = RemoteServices.trigger_charging_settings_update
+
+    async def _trigger_charging_settings_update(
+        self: RemoteServices, **kwargs: Any
+    ) -> Any:
+        updates.append(kwargs)
+        return await trigger_charging_settings_update(self, **kwargs)
+
+    monkeypatch.setattr(
+        RemoteServices,
+        "trigger_charging_settings_update",
+        _trigger_charging_settings_update,
+    )
+
+    async def _async_change(
+        domain: str, service: str, entity_id: str, data: dict[str, Any], state: str
+    ) -> asyncio.Task[Any]:
+        task = asyncio.create_task(
+            hass.services.async_call(
+                domain, service, data, blocking=True, target={"entity_id": entity_id}
+            )
+        )
+        # The new value is shown right away
+        async with asyncio.timeout(1):
+            while hass.states.get(entity_id).state != state:
+                await asyncio.sleep(0)
+        return task
+
+    # Test
+    target_soc = "number.i4_edrive40_target_soc"
+    ac_limit = "select.i4_edrive40_ac_charging_limit"
+    tasks = [
+        await _async_change("number", "set_value", target_soc, {"value": 60}, "60"),
+        await _async_change("number", "set_value", target_soc, {"value": 70}, "70"),
+        await _async_change(
+            "select", "select_option", ac_limit, {"option": "12"}, "12"
+        ),
+    ]
+    assert updates == []
+
+    freezer.tick(3)
+    async_fire_time_changed(hass)
+    await asyncio.gather(*tasks)
+
+    assert updates == [{"target_soc": 70, "ac_limit": 12}]
+    assert hass.states.get(target_soc).state == "70"
+    assert hass.states.get(ac_limit).state == "12"
@@ -1,8 +1,11 @@
 """Test BMW sensors."""
 
+import datetime
+from typing import Any
 from unittest.mock import patch
 
-from bimmer_connected.models import StrEnum
+from bimmer_connected.models import StrEnum, ValueWithUnit
+from bimmer_connected.vehicle import MyBMWVehicle
 from bimmer_connected.vehicle import fuel_and_battery
 from freezegun.api import FrozenDateTimeFactory
 import pytest
@@ -12,10 +15,11 @@ from homeassistant.components.bmw_connected_drive import DOMAIN
 from homeassistant.components.bmw_connected_drive.const import SCAN_INTERVALS
 from homeassistant.components.bmw_connected_drive.sensor import SENSOR_TYPES
 from homeassistant.components.sensor import SensorDeviceClass
-from homeassistant.const import STATE_UNAVAILABLE, Platform
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.translation import async_get_translations
+from homeassistant.util import dt as dt_util
 from homeassistant.util.unit_system import (
     METRIC_SYSTEM as METRIC,
     US_CUSTOMARY_SYSTEM as IMPERIAL,
@@ -147,3 +151,42 @@ async def test_enum_sensor_unknown(
     # Check normal state
     entity = hass.states.get("sensor.i4_edrive40_charging_status")
     assert entity.state == STATE_UNAVAILABLE
+
+
+def _key_path_value(vehicle: MyBMWVehicle, key: str) -> Any:
+    """Read a sensor value by walking the key path on every update."""
+    key_path = key.split(".")
+    state = getattr(vehicle, key_path.pop(0))
+    for attr in key_path:
+        state = getattr(state, attr)
+    if isinstance(state, datetime.datetime) and state.tzinfo is None:
+        state = state.replace(tzinfo=dt_util.get_default_time_zone())
+    elif isinstance(state, ValueWithUnit):
+        state = state.value
+    elif isinstance(state, StrEnum):
+        state = state.value.lower()
+        if state == STATE_UNKNOWN:
+            state = None
+    return state
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_value_accessors(
+    hass: HomeAssistant,
+) -> None:
+    """Test the compiled value accessors against walking the key path."""
+
+    # Setup component
+    mock_config_entry = await setup_mocked_integration(hass)
+    pairs = [
+        (vehicle, description)
+        for vehicle in mock_config_entry.runtime_data.account.vehicles
+        for description in SENSOR_TYPES
+        if description.is_available(vehicle)
+    ]
+
+    # Test
+    for vehicle, description in pairs:
+        assert description.value_fn(vehicle) == _key_path_value(
+            vehicle, description.key
+        )
@@ -0,0 +1,255 @@
+"""Test BMW actions."""
+
+from copy import deepcopy
+from datetime import timedelta
+from typing import Any
+
+from bimmer_connected.models import MyBMWRemoteServiceError
+from bimmer_connected.vehicle.remote_services import RemoteServices
+from freezegun.api import FrozenDateTimeFactory
+import pytest
+import respx
+
+from homeassistant.components.bmw_connected_drive import DOMAIN
+from homeassistant.components.bmw_connected_drive.const import (
+    CONF_SKIP_REDUNDANT_COMMANDS,
+)
+from homeassistant.components.bmw_connected_drive.coordinator import (
+    VEHICLE_REFRESH_COOLDOWN,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr
+from homeassistant.util import dt as dt_util
+
+from . import (
+    FIXTURE_CONFIG_ENTRY,
+    REMOTE_SERVICE_EXC_REASON,
+    setup_mocked_integration,
+)
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def test_update_state(
+    hass: HomeAssistant,
+    bmw_fixture: respx.Router,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test requested refreshes of a vehicle are merged and rate limited."""
+
+    # Setup component
+    config_entry = await setup_mocked_integration(hass)
+    state_calls = bmw_fixture.routes["state"].call_count
+
+    def _refreshed_vins() -> list[str]:
+        return [
+            call.request.headers["bmw-vin"]
+            for call in bmw_fixture.routes["state"].calls[state_calls:]
+        ]
+
+    # Test
+    for _ in range(3):
+        await hass.services.async_call(
+            DOMAIN, "update_state", {"vin": "WBA00000000DEMO02"}, blocking=True
+        )
+    # Only the first request is sent right away
+    assert _refreshed_vins() == ["WBA00000000DEMO02"]
+
+    # The other requests are merged into one at the end of the cooldown
+    freezer.tick(timedelta(seconds=VEHICLE_REFRESH_COOLDOWN))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert _refreshed_vins() == ["WBA00000000DEMO02", "WBA00000000DEMO02"]
+
+    # No request is sent if the poll budget is exhausted
+    config_entry.runtime_data.quota.exhaust(dt_util.utcnow())
+    with pytest.raises(HomeAssistantError, match="request budget"):
+        await hass.services.async_call(
+            DOMAIN, "update_state", {"vin": "WBA00000000DEMO03"}, blocking=True
+        )
+    assert _refreshed_vins() == ["WBA00000000DEMO02", "WBA00000000DEMO02"]
+
+    # The cooldown also applies after a failed refresh
+    await hass.services.async_call(
+        DOMAIN, "update_state", {"vin": "WBA00000000DEMO03"}, blocking=True
+    )
+    assert _refreshed_vins() == ["WBA00000000DEMO02", "WBA00000000DEMO02"]
+
+    # The merged request is sent at the end of the cooldown, the budget
+    # refilled enough for one vehicle in the meantime
+    freezer.tick(timedelta(seconds=VEHICLE_REFRESH_COOLDOWN))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert _refreshed_vins() == [
+        "WBA00000000DEMO02",
+        "WBA00000000DEMO02",
+        "WBA00000000DEMO03",
+    ]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_batch_lock_account(
+    hass: HomeAssistant,
+) -> None:
+    """Test locking all vehicles of an account."""
+
+    # Setup component
+    config_entry = await setup_mocked_integration(hass)
+    assert hass.states.get("lock.i3_rex_lock").state == "unlocked"
+
+    # Test
+    response = await hass.services.async_call(
+        DOMAIN,
+        "batch_lock",
+        {"config_entry_id": config_entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert {v["vin"]: v["state"] for v in response["vehicles"]} == {
+        "WBA00000000DEMO01": "executed",
+        "WBA00000000DEMO02": "executed",
+        "WBA00000000DEMO03": "executed",
+        "WBY00000000REXI01": "executed",
+    }
+    assert hass.states.get("lock.i3_rex_lock").state == "locked"
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_batch_lock_skip_redundant(
+    hass: HomeAssistant,
+) -> None:
+    """Test vehicles already locked are skipped unless forced."""
+
+    # Setup component with redundant commands being skipped
+    config_entry = deepcopy(FIXTURE_CONFIG_ENTRY)
+    config_entry["options"] = {
+        **config_entry["options"],
+        CONF_SKIP_REDUNDANT_COMMANDS: True,
+    }
+    mock_config_entry = MockConfigEntry(**config_entry)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    async def _async_batch_lock(**data: Any) -> dict[str, str]:
+        response = await hass.services.async_call(
+            DOMAIN,
+            "batch_lock",
+            {"vin": ["WBA00000000DEMO03", "WBY00000000REXI01"], **data},
+            blocking=True,
+            return_response=True,
+        )
+        return {v["vin"]: v["state"] for v in response["vehicles"]}
+
+    # Test
+    assert await _async_batch_lock() == {
+        "WBA00000000DEMO03": "skipped",
+        "WBY00000000REXI01": "executed",
+    }
+    assert await _async_batch_lock(force=True) == {
+        "WBA00000000DEMO03": "executed",
+        "WBY00000000REXI01": "executed",
+    }
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_batch_climate_partial_failure(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a failing vehicle does not stop the command for the others."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+    device = device_registry.async_get_device({(DOMAIN, "WBA00000000DEMO02")})
+
+    # Setup exception for a single vehicle
+    triggered: list[tuple[str, dict]] = []
+    trigger_remote_service = RemoteServices.trigger_remote_service
+
+    async def _trigger_remote_service(
+        self: RemoteServices, *args: Any, **kwargs: Any
+    ) -> Any:
+        if self._vehicle.vin == "WBA00000000DEMO01":
+            raise MyBMWRemoteServiceError(REMOTE_SERVICE_EXC_REASON)
+        triggered.append((self._vehicle.vin, kwargs["params"]))
+        return await trigger_remote_service(self, *args, **kwargs)
+
+    monkeypatch.setattr(
+        RemoteServices, "trigger_remote_service", _trigger_remote_service
+    )
+
+    # Test
+    response = await hass.services.async_call(
+        DOMAIN,
+        "batch_climate",
+        {
+            "vin": ["WBA00000000DEMO01"],
+            "device_id": [device.id],
+            "action": "stop",
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {
+        "vehicles": [
+            {
+                "vin": "WBA00000000DEMO01",
+                "name": "iX xDrive50",
+                "state": "failed",
+                "error": REMOTE_SERVICE_EXC_REASON,
+            },
+            {
+                "vin": "WBA00000000DEMO02",
+                "name": "i4 eDrive40",
+                "state": "executed",
+                "error": None,
+            },
+        ]
+    }
+    assert triggered == [("WBA00000000DEMO02", {"action": "STOP"})]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_batch_account_device_ignored(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+) -> None:
+    """Test the service device of an account is not taken for a vehicle."""
+
+    # Setup component
+    config_entry = await setup_mocked_integration(hass)
+    device = device_registry.async_get_device({(DOMAIN, config_entry.unique_id)})
+    assert device is not None
+
+    # Test
+    response = await hass.services.async_call(
+        DOMAIN,
+        "batch_lock",
+        {"vin": ["WBY00000000REXI01"], "device_id": [device.id]},
+        blocking=True,
+        return_response=True,
+    )
+    assert [v["vin"] for v in response["vehicles"]] == ["WBY00000000REXI01"]
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_batch_unknown_vehicle(
+    hass: HomeAssistant,
+) -> None:
+    """Test an unknown vehicle is rejected before any command is sent."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+
+    # Test
+    with pytest.raises(ServiceValidationError, match="WBA00000000NOCAR"):
+        await hass.services.async_call(
+            DOMAIN,
+            "batch_charge_stop",
+            {"vin": ["WBA00000000DEMO01", "WBA00000000NOCAR"]},
+            blocking=True,
+            return_response=True,
+        )
@@ -1,26 +1,41 @@
 """Test BMW switches."""
 
+import asyncio
+from copy import deepcopy
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from bimmer_connected.models import MyBMWAPIError, MyBMWRemoteServiceError
 from bimmer_connected.vehicle.remote_services import RemoteServices
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 import respx
 from syrupy.assertion import SnapshotAssertion
 
+from homeassistant.components.bmw_connected_drive.const import (
+    CONF_BACKGROUND_COMMANDS,
+)
+from homeassistant.components.bmw_connected_drive.entity import (
+    OPTIMISTIC_STATE_TIMEOUT,
+)
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import entity_registry as er
 
 from . import (
+    FIXTURE_CONFIG_ENTRY,
     REMOTE_SERVICE_EXC_REASON,
     REMOTE_SERVICE_EXC_TRANSLATION,
     check_remote_service_call,
     setup_mocked_integration,
 )
 
-from tests.common import snapshot_platform
+from tests.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    snapshot_platform,
+)
 
 
 @pytest.mark.usefixtures("bmw_fixture")
@@ -143,3 +158,81 @@ async def test_service_call_fail(
             target={"entity_id": entity_id},
         )
     assert hass.states.get(entity_id).state == old_value
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_not_confirmed(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the new state is shown until the vehicle should have reported it."""
+
+    # Setup component
+    assert await setup_mocked_integration(hass)
+    entity_id = "switch.m340i_xdrive_climate"
+    assert hass.states.get(entity_id).state == "off"
+
+    # Setup a remote service the vehicle does not act on
+    monkeypatch.setattr(RemoteServices, "trigger_remote_service", AsyncMock())
+
+    # Test
+    await hass.services.async_call(
+        "switch",
+        "turn_on",
+        blocking=True,
+        target={"entity_id": entity_id},
+    )
+    assert hass.states.get(entity_id).state == "on"
+
+    freezer.tick(OPTIMISTIC_STATE_TIMEOUT)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "off"
+
+
+@pytest.mark.usefixtures("bmw_fixture")
+async def test_service_call_background_fail(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test a command failing in the background reverts the optimistic state."""
+
+    # Setup component with remote commands running in the background
+    config_entry = deepcopy(FIXTURE_CONFIG_ENTRY)
+    config_entry["options"] = {
+        **config_entry["options"],
+        CONF_BACKGROUND_COMMANDS: True,
+    }
+    mock_config_entry = MockConfigEntry(**config_entry)
+    mock_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_id = "switch.i4_edrive40_climate"
+    assert hass.states.get(entity_id).state == "on"
+
+    # Setup a remote service that fails after a while
+    release_service = asyncio.Event()
+
+    async def _trigger_remote_service(*args: Any, **kwargs: Any) -> None:
+        await release_service.wait()
+        raise MyBMWRemoteServiceError(REMOTE_SERVICE_EXC_REASON)
+
+    monkeypatch.setattr(
+        RemoteServices, "trigger_remote_service", _trigger_remote_service
+    )
+
+    # Test
+    await hass.services.async_call(
+        "switch",
+        "turn_off",
+        blocking=True,
+        target={"entity_id": entity_id},
+    )
+    assert hass.states.get(entity_id).state == "off"
+
+    release_service.set()
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert hass.states.get(entity_id).state == "on"